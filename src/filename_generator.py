@@ -1,6 +1,5 @@
-import datetime
 import os
-from pathlib import PurePosixPath
+import time
 
 # Resolve paths based on the script's actual location
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))  # Get project root
@@ -10,6 +9,20 @@ INPUT_DIR = os.getenv("INPUT_DIR", os.path.join(BASE_DIR, "data", "input"))
 OUTPUT_DIR = os.getenv("OUTPUT_DIR", os.path.join(BASE_DIR, "data", "output"))
 REPORT_DIR = os.getenv("REPORT_DIR", os.path.join(BASE_DIR, "data", "report"))
 
+# O(1) dispatch from file type to target directory
+_DIR_FOR_TYPE = {"report": REPORT_DIR, "output": OUTPUT_DIR}
+
+# Directories already created this run; skips the makedirs syscall on every
+# generated filename after the first
+_ENSURED_DIRS = set()
+
+
+def _ensure_dir(directory):
+    """Create directory once per process; later calls are a set lookup."""
+    if directory not in _ENSURED_DIRS:
+        os.makedirs(directory, exist_ok=True)
+        _ENSURED_DIRS.add(directory)
+
 def generate_filename(xml_filename, file_type):
     """
     Generate a unique filename with a timestamp and return the full file path.
@@ -21,17 +34,16 @@ def generate_filename(xml_filename, file_type):
     Returns:
         str: Full path to the generated file.
     """
-    # Get filename without extension and extension separately
-    base_name = os.path.splitext(os.path.basename(xml_filename))[0]  # Remove extension
-    input_ext = os.path.splitext(os.path.basename(xml_filename))[1].lower().replace('.', '')  # Get extension without dot
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")  # YYYYMMDD_HHMMSS
-
-    if file_type == "report":
-        directory = REPORT_DIR
-    elif file_type == "output":
-        directory = OUTPUT_DIR
-    else:
+    # Split the basename once; splitext hands back stem and extension together
+    base_name, ext = os.path.splitext(os.path.basename(xml_filename))
+    input_ext = ext.lower().lstrip('.')  # Get extension without dot
+    # time.strftime formats straight from the C struct tm without building
+    # a datetime object per call
+    timestamp = time.strftime("%Y%m%d_%H%M%S")  # YYYYMMDD_HHMMSS
+
+    directory = _DIR_FOR_TYPE.get(file_type)
+    if directory is None:
         raise ValueError("Invalid file type. Must be 'report' or 'output'.")
 
-    os.makedirs(directory, exist_ok=True)  # Ensure directory exists
-    return str(PurePosixPath(directory, f"{base_name}_{input_ext}_{file_type}_{timestamp}.json"))
+    _ensure_dir(directory)
+    return f"{directory}/{base_name}_{input_ext}_{file_type}_{timestamp}.json"
@@ -1,10 +1,71 @@
-import xml.etree.ElementTree as ET
+try:
+    # Prefer lxml's C-backed parser when available, matching the XDP side;
+    # the find/findall API is compatible with the stdlib
+    from lxml import etree as ET
+    _HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAVE_LXML = False
+import functools
 import json
 import os
-import uuid
-from datetime import datetime
+import re
+import sys
+from datetime import datetime, timezone
+
+try:
+    # orjson's C encoder serializes the nested field dicts several times
+    # faster than stdlib json; fall back silently when not installed
+    import orjson
+except ImportError:
+    orjson = None
 from src.report import Report
 
+# Strips HTML tags from rich-text labels; compiled once instead of per label
+_HTML_TAG_RE = re.compile('<[^<]+?>')
+
+# Name-convention fallbacks for determine_field_type; one compiled search
+# per type replaces a lowercase copy plus N substring scans per field.
+# Checked in the original priority order: radio, date, phone, email.
+_RADIO_NAME_RE = re.compile(r'yesno|truefalse|formready', re.IGNORECASE)
+_DATE_NAME_RE = re.compile(r'date|birth|signed', re.IGNORECASE)
+_PHONE_NAME_RE = re.compile(r'phone|tel|mobile|cell', re.IGNORECASE)
+_EMAIL_NAME_RE = re.compile(r'email|mail|e-mail', re.IGNORECASE)
+
+# Bind attributes stored as top-level keys rather than in the attributes dict
+_BIND_META_KEYS = frozenset(('id', 'ref', 'name'))
+
+# Parsed mapping files shared across parser instances, keyed by
+# (path, mtime) so an edited mapping is picked up on the next run
+_MAPPING_CACHE = {}
+
+
+@functools.lru_cache(maxsize=1024)
+def _local(tag):
+    """Strip a Clark-notation namespace from a tag, caching per unique tag.
+
+    Instance elements are normally unqualified, so this is an identity map
+    kept cheap by the cache; it protects the startswith/endswith checks and
+    dict lookups downstream if a form ever qualifies its instance data.
+
+    The result is interned: thousands of repeating-grid fields share the
+    same handful of names, and interning lets the output dicts reference
+    one string object per name instead of one per field.
+    """
+    return sys.intern(tag.rpartition('}')[2])
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_field_name(field_name):
+    """Format a hyphenated field name for display; names repeat per form."""
+    return " ".join(word.capitalize() for word in field_name.split("-"))
+
+
+@functools.lru_cache(maxsize=512)
+def _format_section_name(section_name):
+    """Format a section name for display (drops the section- prefix)."""
+    return _format_field_name(section_name.removeprefix("section-"))
+
 class OrbeonParser:
     def __init__(self, xml_filename, mapping_file=None):
         try:
@@ -17,9 +78,24 @@ class OrbeonParser:
                 mapping_file = os.path.join(project_root, "xml_mapping.json")  # Construct full path
 
             self.mapping_file = mapping_file
-            self.breadcrumb = ""
+            # Breadcrumb kept as a token stack; the joined string is built
+            # lazily in get_breadcrumb and cached until the stack changes
+            self._crumbs = []
+            self._crumb_len = 0
+            self._crumb_cache = ""
             self.id_counter = 1
             self.mapping = self.load_mapping_file()
+            # Index mappings by xmlPath length so suffix matching tests one
+            # slice per distinct length instead of endswith on every entry;
+            # the stored position keeps the original first-match priority
+            self._suffix_index = {}
+            mappings = self.mapping.get("mappings", []) if self.mapping else []
+            for position, m in enumerate(mappings):
+                xml_path = m.get("xmlPath", "")
+                bucket = self._suffix_index.setdefault(len(xml_path), {})
+                if xml_path not in bucket:
+                    bucket[xml_path] = (position, m)
+            self._mapping_path_memo = {}  # breadcrumb path -> resolved mapping (or None)
             self.namespaces = {
                 'xh': 'http://www.w3.org/1999/xhtml',
                 'xf': 'http://www.w3.org/2002/xforms',
@@ -27,28 +103,43 @@ class OrbeonParser:
                 'fb': 'http://orbeon.org/oxf/xml/form-builder',
                 'xxf': 'http://orbeon.org/oxf/xml/xforms'
             }
+            self._xpath_cache = {}  # expression string -> compiled XPath (lxml only)
 
-            # Parse the XML file
-            self.tree = ET.parse(xml_filename)
+            # Parse the XML file (lxml raises OSError on missing files, so
+            # check explicitly to keep the stdlib FileNotFoundError behaviour)
+            if not os.path.exists(xml_filename):
+                raise FileNotFoundError(f"XML file {xml_filename} not found")
+            if _HAVE_LXML:
+                # collect_ids=False skips building the xml:id hash (Orbeon
+                # binds are matched by attribute, not xml:id); huge_tree
+                # lifts libxml2's depth/size guards for very large forms.
+                # Comments and PIs are stripped so the tree matches what the
+                # stdlib parser produces - lxml otherwise yields them during
+                # iteration with non-string tags that break tag handling.
+                parser = ET.XMLParser(collect_ids=False, huge_tree=True,
+                                      remove_comments=True, remove_pis=True)
+                self.tree = ET.parse(xml_filename, parser)
+            else:
+                self.tree = ET.parse(xml_filename)
             self.root = self.tree.getroot()
             
             # Get form instance - the main data container in Orbeon
-            self.form_instance = self.root.find(".//xf:instance[@id='fr-form-instance']", self.namespaces)
+            self.form_instance = self._find(self.root, ".//xf:instance[@id='fr-form-instance']")
             if self.form_instance is None:
                 raise ValueError("Form instance not found in Orbeon XML")
                 
-            self.form_data = self.form_instance.find(".//form", self.namespaces)
+            self.form_data = self._find(self.form_instance, ".//form")
             if self.form_data is None:
                 raise ValueError("Form data not found in Orbeon XML")
 
             # Find bind elements for additional metadata
-            self.form_binds = self.root.find(".//xf:bind[@id='fr-form-binds']", self.namespaces)
+            self.form_binds = self._find(self.root, ".//xf:bind[@id='fr-form-binds']")
             self.binds_map = {}
             if self.form_binds is not None:
                 self.extract_binds(self.form_binds)
 
             # Get form resources for labels
-            self.form_resources = self.root.find(".//xf:instance[@id='fr-form-resources']", self.namespaces)
+            self.form_resources = self._find(self.root, ".//xf:instance[@id='fr-form-resources']")
             if self.form_resources is None:
                 raise ValueError("Form resources not found in Orbeon XML")
 
@@ -60,38 +151,60 @@ class OrbeonParser:
             print(f"Error initializing OrbeonParser: {e}")
             raise
     
+    def _xp(self, expr):
+        """Return a compiled XPath object for expr, cached per instance."""
+        xp = self._xpath_cache.get(expr)
+        if xp is None:
+            xp = ET.XPath(expr, namespaces=self.namespaces)
+            self._xpath_cache[expr] = xp
+        return xp
+
+    def _findall(self, elem, expr):
+        """findall that reuses compiled XPath objects when lxml is available."""
+        if _HAVE_LXML:
+            return self._xp(expr)(elem)
+        return elem.findall(expr, self.namespaces)
+
+    def _find(self, elem, expr):
+        """find that reuses compiled XPath objects when lxml is available."""
+        if _HAVE_LXML:
+            results = self._xp(expr)(elem)
+            return results[0] if results else None
+        return elem.find(expr, self.namespaces)
+
     def extract_binds(self, bind_element, parent_path=""):
         """Extract bind information from the form to get metadata"""
         try:
-            for bind in bind_element:
-                if 'id' in bind.attrib and 'ref' in bind.attrib:
-                    bind_id = bind.attrib['id']
-                    ref = bind.attrib['ref']
-                    name = bind.attrib.get('name', '')
-                    
-                    # Build path
-                    path = f"{parent_path}/{ref}" if parent_path else ref
-                    
-                    # Store bind information
-                    self.binds_map[path] = {
-                        'id': bind_id,
-                        'name': name,
-                        'attributes': {k: v for k, v in bind.attrib.items() if k not in ['id', 'ref', 'name']}
-                    }
-                    
-                    # Process nested binds
-                    self.extract_binds(bind, path)
+            # Explicit stack instead of one Python frame per nesting level;
+            # binds_map is keyed by full path, so visit order is irrelevant
+            stack = [(bind_element, parent_path)]
+            while stack:
+                element, element_path = stack.pop()
+                for bind in element:
+                    if 'id' in bind.attrib and 'ref' in bind.attrib:
+                        bind_id = bind.attrib['id']
+                        ref = bind.attrib['ref']
+                        name = bind.attrib.get('name', '')
+                        
+                        # Build path
+                        path = f"{element_path}/{ref}" if element_path else ref
+                        
+                        # Store bind information
+                        self.binds_map[path] = {
+                            'id': bind_id,
+                            'name': name,
+                            'attributes': {k: v for k, v in bind.attrib.items() if k not in _BIND_META_KEYS}
+                        }
+                        
+                        # Process nested binds
+                        stack.append((bind, path))
         except Exception as e:
             print(f"Error extracting binds: {e}")
     
     def get_bind_info(self, field_name, section_path=""):
         """Get bind information for a field"""
-        try:
-            path = f"{section_path}/{field_name}" if section_path else field_name
-            return self.binds_map.get(path)
-        except Exception as e:
-            print(f"Error getting bind info: {e}")
-            return None
+        path = f"{section_path}/{field_name}" if section_path else field_name
+        return self.binds_map.get(path)
     
     def load_mapping_file(self):
         try:
@@ -99,61 +212,82 @@ class OrbeonParser:
             if not os.path.exists(self.mapping_file):
                 raise FileNotFoundError(f"Mapping file {self.mapping_file} not found")
             
-            with open(self.mapping_file, 'r') as f:
-                return json.load(f)
+            # The mapping is immutable per run; batch conversions construct
+            # one parser per form, so share the parsed dict across instances
+            cache_key = (self.mapping_file, os.path.getmtime(self.mapping_file))
+            mapping = _MAPPING_CACHE.get(cache_key)
+            if mapping is None:
+                if orjson is not None:
+                    # orjson decodes straight from bytes, so read binary
+                    with open(self.mapping_file, 'rb') as f:
+                        mapping = orjson.loads(f.read())
+                else:
+                    with open(self.mapping_file, 'r') as f:
+                        mapping = json.load(f)
+                _MAPPING_CACHE[cache_key] = mapping
+            return mapping
         except Exception as e:
             print(f"Error loading mapping file: {e}")
             return None
     
     def add_breadcrumb(self, tag):
-        try:
-            """Add element tag to breadcrumb path"""
-            self.breadcrumb += f"<{tag}>"
-            if len(self.breadcrumb) > 200:
-                self.breadcrumb = self.breadcrumb[-200:]
-        except Exception as e:
-            print(f"Error adding breadcrumb: {e}")
+        """Add element tag to breadcrumb path"""
+        token = f"<{tag}>"
+        self._crumbs.append(token)
+        self._crumb_len += len(token)
+        # Keep only the trailing ~200 chars of path; drop whole tokens
+        # from the front instead of slicing a rebuilt string
+        while self._crumb_len > 200 and len(self._crumbs) > 1:
+            self._crumb_len -= len(self._crumbs.pop(0))
+        self._crumb_cache = None
     
     def remove_breadcrumb(self, tag):
-        try:
-            """Remove the last element tag from breadcrumb"""
-            tag_str = f"<{tag}>"
-            index = self.breadcrumb.rfind(tag_str)
-            if index != -1:
-                self.breadcrumb = self.breadcrumb[:index]
-        except Exception as e:
-            print(f"Error removing breadcrumb: {e}")
+        """Remove the last element tag from breadcrumb"""
+        token = f"<{tag}>"
+        for i in range(len(self._crumbs) - 1, -1, -1):
+            if self._crumbs[i] == token:
+                self._crumb_len -= sum(len(t) for t in self._crumbs[i:])
+                del self._crumbs[i:]
+                self._crumb_cache = None
+                break
     
     def get_breadcrumb(self):
-        try:
-            """Get current breadcrumb path"""
-            return self.breadcrumb
-        except Exception as e:
-            print(f"Error getting breadcrumb: {e}")
-            return ""
+        """Get current breadcrumb path"""
+        if self._crumb_cache is None:
+            self._crumb_cache = "".join(self._crumbs)
+        return self._crumb_cache
     
     def next_id(self):
-        try:
-            """Get next unique ID and increment counter"""
-            current_id = str(self.id_counter)
-            self.id_counter += 1
-            return current_id
-        except Exception as e:
-            print(f"Error generating next ID: {e}")
-            return str(uuid.uuid4())
+        """Get next unique ID and increment counter"""
+        current_id = str(self.id_counter)
+        self.id_counter += 1
+        return current_id
     
     def find_mapping_for_path(self, path):
-        try:
-            """Find mapping configuration for given path"""
-            for mapping in self.mapping.get("mappings", []):
-                if path.endswith(mapping.get("xmlPath", "")):
-                    return mapping
-            return None
-        except Exception as e:
-            print(f"Error finding mapping for path: {e}")
-            return None
+        """Find mapping configuration for given path"""
+        # Sibling fields repeat breadcrumb paths, so memoize per path
+        # (misses included - None is a valid cached answer)
+        if path in self._mapping_path_memo:
+            return self._mapping_path_memo[path]
+
+        best = None
+        path_len = len(path)
+        for length, bucket in self._suffix_index.items():
+            if length > path_len:
+                continue
+            entry = bucket.get(path[path_len - length:])
+            if entry is not None and (best is None or entry[0] < best[0]):
+                best = entry
+        result = best[1] if best is not None else None
+        self._mapping_path_memo[path] = result
+        return result
     
     def create_output_structure(self):
+        # One timestamp per parse; isoformat is much cheaper than strftime
+        # and both return branches below want the same instant anyway.
+        # Taken in real UTC so the +00:00 offset in the output is honest
+        # rather than stamped onto local time.
+        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
         try:
             """Create the base output JSON structure"""
 
@@ -164,7 +298,7 @@ class OrbeonParser:
                 "version": None,
                 "ministry_id": self.mapping["constants"]["ministry_id"],
                 "id": None,
-                "lastModified": datetime.now().strftime("%Y-%m-%dT%H:%M:%S+00:00"),
+                "lastModified": timestamp,
                 "title": None,
                 "form_id": form_id,
                 "deployed_to": None,
@@ -181,7 +315,7 @@ class OrbeonParser:
                 "version": None,
                 "ministry_id": "0",
                 "id": None,
-                "lastModified": datetime.now().strftime("%Y-%m-%dT%H:%M:%S+00:00"),
+                "lastModified": timestamp,
                 "title": None,
                 "form_id": "FORM0001",
                 "deployed_to": None,
@@ -204,6 +338,23 @@ class OrbeonParser:
             print(f"Error in main parse method: {e}")
             return None
     
+    def to_json_bytes(self, pretty=False):
+        """Serialize the parsed output to UTF-8 JSON bytes.
+
+        Uses orjson when available; callers writing to disk should open the
+        file in binary mode and write the returned bytes directly. pretty
+        indents the output for manual inspection instead of the compact
+        default.
+        """
+        if orjson is not None:
+            options = orjson.OPT_INDENT_2 if pretty else 0
+            return orjson.dumps(self.output_json, option=options)
+        if pretty:
+            payload = json.dumps(self.output_json, indent=4, ensure_ascii=False)
+        else:
+            payload = json.dumps(self.output_json, separators=(",", ":"), ensure_ascii=False)
+        return payload.encode("utf-8")
+    
     def process_form_sections(self):
         try:
             """Process all sections in the form"""
@@ -217,7 +368,7 @@ class OrbeonParser:
     def process_section(self, section):
         try:
             """Process a section in the form"""
-            section_name = section.tag
+            section_name = _local(section.tag)
             self.add_breadcrumb(section_name)
             
             # Get section label
@@ -236,9 +387,15 @@ class OrbeonParser:
                 }
                 self.all_items.append(section_obj)
             
-            # Process each grid in the section
+            # Process each grid in the section, collecting nested sections
+            # (like section-child-information within section-a) in the same
+            # pass instead of re-scanning the children twice afterwards
+            nested_sections = []
             for grid in section:
-                grid_name = grid.tag
+                grid_name = _local(grid.tag)
+                
+                if grid_name.startswith("section-"):
+                    nested_sections.append(grid)
                 
                 # Skip processing if this is not a grid element
                 if not grid_name.startswith("grid-"):
@@ -251,7 +408,7 @@ class OrbeonParser:
                 
                 # Handle grid iterations differently (they can contain repeating fields)
                 iteration_tag = f"{grid_name}-iteration"
-                iterations = grid.findall(f"./{iteration_tag}", self.namespaces)
+                iterations = self._findall(grid, f"./{iteration_tag}")
                 
                 if iterations:
                     # This is a repeating grid
@@ -266,22 +423,13 @@ class OrbeonParser:
                 
                 self.remove_breadcrumb(grid_name)
             
-            # Check if there are nested sections (like section-child-information within section-a)
-            nested_sections = False
-            for item in section:
-                if item.tag.startswith("section-"):
-                    nested_sections = True
-                    break
-            
             # If this section has nested sections, process them separately
-            if nested_sections:
-                for nested_section in section:
-                    if nested_section.tag.startswith("section-"):
-                        self.process_section(nested_section)
+            for nested_section in nested_sections:
+                self.process_section(nested_section)
             
             self.remove_breadcrumb(section_name)
         except Exception as e:
-            print(f"Error processing section {section.tag if hasattr(section, 'tag') else 'unknown'}: {e}")
+            print(f"Error processing section {getattr(section, 'tag', 'unknown')}: {e}")
     
     def process_grid_iteration(self, iteration):
         try:
@@ -296,16 +444,16 @@ class OrbeonParser:
     def process_field(self, field_elem):
         try:
             """Process a field element"""
-            field_name = field_elem.tag
+            field_name = _local(field_elem.tag)
             field_value = None
             
             # For text-info fields, first check form instance for text content
-            form_instance_elem = self.form_instance.find(f".//{field_name}/text", self.namespaces)
+            form_instance_elem = self._find(self.form_instance, f".//{field_name}/text")
             if form_instance_elem is not None:
                 field_value = form_instance_elem.text
             else:
                 # Then check the field element itself
-                text_elem = field_elem.find(".//text", self.namespaces)
+                text_elem = self._find(field_elem, ".//text")
                 if text_elem is not None:
                     field_value = text_elem.text
                 else:
@@ -325,13 +473,16 @@ class OrbeonParser:
             
             # Check if field is bound to an input
             field_type = self.determine_field_type(field_name, field_value, field_attributes, mapping)
+            if field_type is not None:
+                # Interned so every field of a given type shares one string
+                field_type = sys.intern(field_type)
             
             # Special handling for explanation fields
-            explanation_elem = self.root.find(f".//fr:explanation[@bind='{field_name}-bind']", self.namespaces)
+            explanation_elem = self._find(self.root, f".//fr:explanation[@bind='{field_name}-bind']")
             if explanation_elem is not None:
                 field_type = "text-info"
                 # Get text content from form resources
-                text_ref = explanation_elem.find(".//fr:text", self.namespaces)
+                text_ref = self._find(explanation_elem, ".//fr:text")
                 if text_ref is not None:
                     # Extract the reference path
                     ref_path = text_ref.get("ref")
@@ -339,7 +490,7 @@ class OrbeonParser:
                         # Remove the $form-resources/ prefix
                         ref_path = ref_path[len("$form-resources/"):]
                         # Find the text in form resources
-                        resource_text = self.form_resources.find(f".//resource/{ref_path}", self.namespaces)
+                        resource_text = self._find(self.form_resources, f".//resource/{ref_path}")
                         if resource_text is not None:
                             field_value = resource_text.text
             
@@ -365,7 +516,7 @@ class OrbeonParser:
             # Process checkbox value
             if field_type == "checkbox":
                 # Check for explicit value in XML
-                value_elem = field_elem.find(".//value", self.namespaces)
+                value_elem = self._find(field_elem, ".//value")
                 if value_elem is not None and value_elem.text:
                     field_obj["value"] = value_elem.text.lower() == "true"
                 else:
@@ -391,8 +542,8 @@ class OrbeonParser:
             
             return field_obj
         except Exception as e:
-            print(f"Error processing field {field_elem.tag if hasattr(field_elem, 'tag') else 'unknown'}: {e}")
-            self.Report.report_error(field_elem.tag if hasattr(field_elem, 'tag') else "unknown", 
+            print(f"Error processing field {getattr(field_elem, 'tag', 'unknown')}: {e}")
+            self.Report.report_error(getattr(field_elem, 'tag', 'unknown'), 
                                     "unknown", 
                                     "Error processing field")
             return None
@@ -413,12 +564,12 @@ class OrbeonParser:
                 return "file"
             
             # Check for file upload bindings
-            file_upload_elem = self.root.find(f".//fr:attachment[@bind='{field_name}-bind']", self.namespaces)
+            file_upload_elem = self._find(self.root, f".//fr:attachment[@bind='{field_name}-bind']")
             if file_upload_elem is not None:
                 return "file"
             
             # Check for file upload in form instance
-            file_instance = self.form_instance.find(f".//{field_name}", self.namespaces)
+            file_instance = self._find(self.form_instance, f".//{field_name}")
             if file_instance is not None and (file_instance.get('mediatype') or file_instance.get('filename')):
                 return "file"
             
@@ -427,105 +578,105 @@ class OrbeonParser:
                 return "radio"
             
             # Check if field has an explanation element
-            explanation_elem = self.root.find(f".//fr:explanation[@bind='{field_name}-bind']", self.namespaces)
+            explanation_elem = self._find(self.root, f".//fr:explanation[@bind='{field_name}-bind']")
             if explanation_elem is not None:
                 return "text-info"
             
             # Check if field is a control with text tag
             if field_name.startswith("control-"):
                 # Then check directly in the field element
-                text_elem = self.form_instance.find(f".//{field_name}/text", self.namespaces)
+                text_elem = self._find(self.form_instance, f".//{field_name}/text")
                 if text_elem is not None:
                     return "text-info"
                 
                 # Check if it's a radio button by looking for items with labels and values
                 # First check in the field element itself
-                items = self.form_instance.findall(f".//{field_name}/item", self.namespaces)
+                items = self._findall(self.form_instance, f".//{field_name}/item")
                 if items:
                     for item in items:
-                        label = item.find("label", self.namespaces)
-                        value = item.find("value", self.namespaces)
+                        label = self._find(item, "label")
+                        value = self._find(item, "value")
                         if label is not None and value is not None:
                             return "radio"
                 
                 # If not found in field element, check in form resources
-                control_elem = self.form_resources.find(f".//{field_name}", self.namespaces)
+                control_elem = self._find(self.form_resources, f".//{field_name}")
                 if control_elem is not None:
-                    items = control_elem.findall(".//item", self.namespaces)
+                    items = self._findall(control_elem, ".//item")
                     if items:
                         for item in items:
-                            label = item.find("label", self.namespaces)
-                            value = item.find("value", self.namespaces)
+                            label = self._find(item, "label")
+                            value = self._find(item, "value")
                             if label is not None and value is not None:
                                 return "radio"
             
             # Check if field is bound to an input
-            bind_elem = self.root.find(f".//xf:bind[@ref='{field_name}']", self.namespaces)
+            bind_elem = self._find(self.root, f".//xf:bind[@ref='{field_name}']")
             if bind_elem is not None:
                 # Check for checkbox-input elements first
-                checkbox_input_elem = self.root.find(f".//fr:checkbox-input[@bind='{field_name}-bind']", self.namespaces)
+                checkbox_input_elem = self._find(self.root, f".//fr:checkbox-input[@bind='{field_name}-bind']")
                 if checkbox_input_elem is not None:
                     return "checkbox"
                 
                 # Check for select1 elements (dropdowns or radio buttons)
-                select1_elem = self.root.find(f".//xf:select1[@bind='{field_name}-bind']", self.namespaces)
+                select1_elem = self._find(self.root, f".//xf:select1[@bind='{field_name}-bind']")
                 if select1_elem is not None:
                     # Check if it's a radio button group
                     appearance = select1_elem.get("appearance", "")
                     if appearance == "full":
                         return "radio"
                     # Check for specific field names that should be radio buttons
-                    if any(radio_indicator in field_name.lower() for radio_indicator in ['yesno', 'truefalse', 'formready']):
+                    if _RADIO_NAME_RE.search(field_name):
                         return "radio"
                     # Default to dropdown
                     return "dropdown"
                 
                 # Check for textarea elements
-                textarea_elem = self.root.find(f".//xf:textarea[@bind='{field_name}-bind']", self.namespaces)
+                textarea_elem = self._find(self.root, f".//xf:textarea[@bind='{field_name}-bind']")
                 if textarea_elem is not None:
                     return "text-area"
                 
                 # Check for date elements
-                date_elem = self.root.find(f".//fr:date[@bind='{field_name}-bind']", self.namespaces)
+                date_elem = self._find(self.root, f".//fr:date[@bind='{field_name}-bind']")
                 if date_elem is not None:
                     return "date"
                 
                 # Check for currency elements
-                currency_elem = self.root.find(f".//fr:currency[@bind='{field_name}-bind']", self.namespaces)
+                currency_elem = self._find(self.root, f".//fr:currency[@bind='{field_name}-bind']")
                 if currency_elem is not None:
                     return "currency"
                 
                 # Check for checkbox elements - look for both input and checkbox elements
-                checkbox_elem = self.root.find(f".//xf:input[@bind='{field_name}-bind']", self.namespaces)
+                checkbox_elem = self._find(self.root, f".//xf:input[@bind='{field_name}-bind']")
                 if checkbox_elem is not None:
                     # Check if it's a checkbox by looking at type or appearance
                     if checkbox_elem.get("type") == "checkbox" or checkbox_elem.get("appearance") == "checkbox":
                         return "checkbox"
                 
                 # Also check for checkbox elements in the form instance
-                checkbox_instance = self.form_instance.find(f".//{field_name}", self.namespaces)
+                checkbox_instance = self._find(self.form_instance, f".//{field_name}")
                 if checkbox_instance is not None and checkbox_instance.get("type") == "checkbox":
                     return "checkbox"
             
             # Check if field is a resource
             if field_name.startswith("control-") and field_value is None:
                 # Check if the resource has a text tag
-                text_elem = self.form_instance.find(f".//form//{field_name}/text", self.namespaces)
+                text_elem = self._find(self.form_instance, f".//form//{field_name}/text")
                 if text_elem is not None:
                     return "text-info"
                 # If no text tag, treat as text-input
                 return "text-input"
             
             # Check for date fields by name
-            if any(date_indicator in field_name.lower() for date_indicator in ['date', 'birth', 'signed']):
+            if _DATE_NAME_RE.search(field_name):
                 return "date"
             
             # Check for phone number fields
-            if any(phone_indicator in field_name.lower() for phone_indicator in ['phone', 'tel', 'mobile', 'cell']):
+            if _PHONE_NAME_RE.search(field_name):
                 return "phone"
             
             # Check for email fields
-            if any(email_indicator in field_name.lower() for email_indicator in ['email', 'mail', 'e-mail']):
+            if _EMAIL_NAME_RE.search(field_name):
                 return "email"
             
             # Default to text input
@@ -534,6 +685,290 @@ class OrbeonParser:
             print(f"Error determining field type for {field_name}: {e}")
             return "text-input"
     
+    # Prototype dicts for the per-type builders: copy() duplicates the whole
+    # shape in one C-level pass instead of rebuilding ~12 literal slots per
+    # field. Mutable slots (codeContext, validation) are None in the
+    # prototypes and reassigned after the shallow copy.
+    _TEXT_INFO_PROTO = {
+        "type": "text-info",
+        "id": None,
+        "label": None,
+        "styles": None,
+        "mask": None,
+        "codeContext": None,
+        "value": None
+    }
+
+    def _build_text_info(self, field_name, field_value, field_attributes, label, validation_rules):
+        field_obj = self._TEXT_INFO_PROTO.copy()
+        field_obj["id"] = self.next_id()
+        field_obj["label"] = label
+        field_obj["codeContext"] = {"name": field_name}
+        field_obj["value"] = field_value
+        return field_obj
+
+    _TEXT_INPUT_PROTO = {
+        "type": "text-input",
+        "id": None,
+        "label": None,
+        "styles": None,
+        "mask": None,
+        "codeContext": None,
+        "placeholder": None,
+        "inputType": "text",
+        "validation": None
+    }
+
+    def _build_text_input(self, field_name, field_value, field_attributes, label, validation_rules):
+        field_obj = self._TEXT_INPUT_PROTO.copy()
+        field_obj["id"] = self.next_id()
+        field_obj["label"] = label
+        field_obj["codeContext"] = {"name": field_name}
+        field_obj["validation"] = validation_rules
+        if field_value:
+            field_obj["value"] = field_value
+        return field_obj
+
+    _TEXT_AREA_PROTO = {
+        "type": "text-area",
+        "id": None,
+        "label": None,
+        "styles": None,
+        "codeContext": None,
+        "placeholder": None,
+        "validation": None
+    }
+
+    def _build_text_area(self, field_name, field_value, field_attributes, label, validation_rules):
+        field_obj = self._TEXT_AREA_PROTO.copy()
+        field_obj["id"] = self.next_id()
+        field_obj["label"] = label
+        field_obj["codeContext"] = {"name": field_name}
+        field_obj["validation"] = validation_rules
+        if field_value and field_value.strip():
+            field_obj["value"] = field_value.strip()
+        return field_obj
+
+    _DATE_PROTO = {
+        "type": "date",
+        "id": None,
+        "fieldId": None,
+        "label": None,
+        "placeholder": None,
+        "mask": "yyyy-MM-dd",
+        "codeContext": None,
+        "validation": None
+    }
+
+    def _build_date(self, field_name, field_value, field_attributes, label, validation_rules):
+        field_obj = self._DATE_PROTO.copy()
+        field_obj["id"] = self.next_id()
+        field_obj["fieldId"] = self.next_id()
+        field_obj["label"] = label
+        field_obj["codeContext"] = {"name": field_name}
+        field_obj["validation"] = validation_rules
+        if field_value and field_value.strip():
+            field_obj["value"] = field_value.strip()
+        return field_obj
+
+    _CHECKBOX_PROTO = {
+        "type": "checkbox",
+        "id": None,
+        "label": None,
+        "webStyles": None,
+        "pdfStyles": None,
+        "mask": None,
+        "codeContext": None,
+        "value": False,
+        "validation": None
+    }
+
+    def _build_checkbox(self, field_name, field_value, field_attributes, label, validation_rules):
+        field_obj = self._CHECKBOX_PROTO.copy()
+        field_obj["id"] = self.next_id()
+        field_obj["label"] = label
+        field_obj["codeContext"] = {"name": field_name}
+        field_obj["value"] = field_value == "true" if field_value is not None else False
+        field_obj["validation"] = validation_rules
+        return field_obj
+
+    _RADIO_PROTO = {
+        "type": "radio",
+        "id": None,
+        "label": None,
+        "styles": None,
+        "codeContext": None,
+        "listItems": None,
+        "direction": "vertical",
+        "validation": None
+    }
+
+    def _build_radio(self, field_name, field_value, field_attributes, label, validation_rules):
+        field_obj = self._RADIO_PROTO.copy()
+        field_obj["id"] = self.next_id()
+        field_obj["label"] = label
+        field_obj["codeContext"] = {"name": field_name}
+        field_obj["listItems"] = []
+        field_obj["validation"] = validation_rules
+        if field_value and field_value.strip():
+            field_obj["value"] = field_value.strip()
+        return field_obj
+
+    _DROPDOWN_PROTO = {
+        "id": None,
+        "mask": None,
+        "size": "md",
+        "type": "dropdown",
+        "label": None,
+        "styles": None,
+        "isMulti": False,
+        "isInline": False,
+        "direction": "bottom",
+        "listItems": None,
+        "codeContext": None,
+        "placeholder": "",
+        "selectionFeedback": "top-after-reopen",
+        "validation": None
+    }
+
+    def _build_dropdown(self, field_name, field_value, field_attributes, label, validation_rules):
+        field_obj = self._DROPDOWN_PROTO.copy()
+        field_obj["id"] = self.next_id()
+        field_obj["label"] = label
+        field_obj["listItems"] = []
+        field_obj["codeContext"] = {"name": field_name}
+        field_obj["validation"] = validation_rules
+        if field_value and field_value.strip():
+            field_obj["value"] = field_value.strip()
+        return field_obj
+
+    _SIGNATURE_PROTO = {
+        "type": "signature",
+        "id": None,
+        "label": None,
+        "styles": None,
+        "codeContext": None,
+        "validation": None
+    }
+
+    def _build_signature(self, field_name, field_value, field_attributes, label, validation_rules):
+        field_obj = self._SIGNATURE_PROTO.copy()
+        field_obj["id"] = self.next_id()
+        field_obj["label"] = label
+        field_obj["codeContext"] = {"name": field_name}
+        field_obj["validation"] = validation_rules
+        if field_value and field_value.strip():
+            field_obj["value"] = field_value.strip()
+        return field_obj
+
+    _EMAIL_PROTO = {
+        "type": "text-input",
+        "id": None,
+        "label": None,
+        "styles": None,
+        "mask": None,
+        "codeContext": None,
+        "placeholder": "example@example.com",
+        "inputType": "email",
+        "validation": None
+    }
+
+    def _build_email(self, field_name, field_value, field_attributes, label, validation_rules):
+        field_obj = self._EMAIL_PROTO.copy()
+        field_obj["id"] = self.next_id()
+        field_obj["label"] = label
+        field_obj["codeContext"] = {"name": field_name}
+        field_obj["validation"] = validation_rules
+        if field_value and field_value.strip():
+            field_obj["value"] = field_value.strip()
+        return field_obj
+
+    _PHONE_PROTO = {
+        "type": "text-input",
+        "id": None,
+        "label": None,
+        "styles": None,
+        "mask": "(###) ###-####",
+        "codeContext": None,
+        "placeholder": "(123) 456-7890",
+        "inputType": "tel",
+        "validation": None
+    }
+
+    def _build_phone(self, field_name, field_value, field_attributes, label, validation_rules):
+        field_obj = self._PHONE_PROTO.copy()
+        field_obj["id"] = self.next_id()
+        field_obj["label"] = label
+        field_obj["codeContext"] = {"name": field_name}
+        field_obj["validation"] = validation_rules
+        if field_value and field_value.strip():
+            field_obj["value"] = field_value.strip()
+        return field_obj
+
+    _ADDRESS_PROTO = {
+        "type": "text-area",
+        "id": None,
+        "label": None,
+        "styles": None,
+        "codeContext": None,
+        "placeholder": "Street address",
+        "validation": None
+    }
+
+    def _build_address(self, field_name, field_value, field_attributes, label, validation_rules):
+        field_obj = self._ADDRESS_PROTO.copy()
+        field_obj["id"] = self.next_id()
+        field_obj["label"] = label
+        field_obj["codeContext"] = {"name": field_name}
+        field_obj["validation"] = validation_rules
+        if field_value and field_value.strip():
+            field_obj["value"] = field_value.strip()
+        return field_obj
+
+    _FILE_PROTO = {
+        "type": "file",
+        "id": None,
+        "label": None,
+        "styles": None,
+        "codeContext": None,
+        "accept": "*/*",
+        "multiple": False,
+        "maxSize": None,  # Can be set from mapping if needed
+        "validation": None
+    }
+
+    def _build_file(self, field_name, field_value, field_attributes, label, validation_rules):
+        field_obj = self._FILE_PROTO.copy()
+        field_obj["id"] = self.next_id()
+        field_obj["label"] = label
+        field_obj["codeContext"] = {"name": field_name}
+        field_obj["accept"] = field_attributes.get('mediatype', '*/*')
+        field_obj["validation"] = validation_rules
+        if field_value:
+            field_obj["value"] = field_value
+        if field_attributes.get('filename'):
+            field_obj["filename"] = field_attributes.get('filename')
+        if field_attributes.get('size'):
+            field_obj["size"] = field_attributes.get('size')
+        return field_obj
+
+    # One hash lookup replaces the long if/elif chain over field types;
+    # email/phone/address intentionally reuse the text-input/text-area shapes
+    _FIELD_BUILDERS = {
+        "text-info": _build_text_info,
+        "text-input": _build_text_input,
+        "text-area": _build_text_area,
+        "date": _build_date,
+        "checkbox": _build_checkbox,
+        "radio": _build_radio,
+        "dropdown": _build_dropdown,
+        "signature": _build_signature,
+        "email": _build_email,
+        "phone": _build_phone,
+        "address": _build_address,
+        "file": _build_file,
+    }
+
     def create_field_object(self, field_type, field_name, field_value, field_attributes, mapping):
         """Create field object based on field type"""
         field_obj = None
@@ -598,193 +1033,10 @@ class OrbeonParser:
         if not label:
             label = bind_info.get('name', '') if bind_info and bind_info.get('name') else self.format_field_name(field_name)
         
-        if field_type == "text-info":
-            field_obj = {
-                "type": "text-info",
-                "id": self.next_id(),
-                "label": label,
-                "styles": None,
-                "mask": None,
-                "codeContext": {
-                    "name": field_name
-                },
-                "value": field_value
-            }
-        elif field_type == "text-input":
-            field_obj = {
-                "type": "text-input",
-                "id": self.next_id(),
-                "label": label,
-                "styles": None,
-                "mask": None,
-                "codeContext": {
-                    "name": field_name
-                },
-                "placeholder": None,
-                "inputType": "text",
-                "validation": validation_rules
-            }
-            if field_value:
-                field_obj["value"] = field_value
-        elif field_type == "text-area":
-            field_obj = {
-                "type": "text-area",
-                "id": self.next_id(),
-                "label": label,
-                "styles": None,
-                "codeContext": {
-                    "name": field_name
-                },
-                "placeholder": None,
-                "validation": validation_rules
-            }
-            if field_value and field_value.strip():
-                field_obj["value"] = field_value.strip()
-        elif field_type == "date":
-            field_obj = {
-                "type": "date",
-                "id": self.next_id(),
-                "fieldId": self.next_id(),
-                "label": label,
-                "placeholder": None,
-                "mask": "yyyy-MM-dd",
-                "codeContext": {
-                    "name": field_name
-                },
-                "validation": validation_rules
-            }
-            if field_value and field_value.strip():
-                field_obj["value"] = field_value.strip()
-        elif field_type == "checkbox":
-            field_obj = {
-                "type": "checkbox",
-                "id": self.next_id(),
-                "label": label,
-                "webStyles": None,
-                "pdfStyles": None,
-                "mask": None,
-                "codeContext": {
-                    "name": field_name
-                },
-                "value": field_value == "true" if field_value is not None else False,
-                "validation": validation_rules
-            }
-        elif field_type == "radio":
-            field_obj = {
-                "type": "radio",
-                "id": self.next_id(),
-                "label": label,
-                "styles": None,
-                "codeContext": {
-                    "name": field_name
-                },
-                "listItems": [],
-                "direction": "vertical",
-                "validation": validation_rules
-            }
-            if field_value and field_value.strip():
-                field_obj["value"] = field_value.strip()
-        elif field_type == "dropdown":
-            field_obj = {
-                "id": self.next_id(),
-                "mask": None,
-                "size": "md",
-                "type": "dropdown",
-                "label": label,
-                "styles": None,
-                "isMulti": False,
-                "isInline": False,
-                "direction": "bottom",
-                "listItems": [],
-                "codeContext": {
-                    "name": field_name
-                },
-                "placeholder": "",
-                "selectionFeedback": "top-after-reopen",
-                "validation": validation_rules
-            }
-            if field_value and field_value.strip():
-                field_obj["value"] = field_value.strip()
-        elif field_type == "signature":
-            field_obj = {
-                "type": "signature",
-                "id": self.next_id(),
-                "label": label,
-                "styles": None,
-                "codeContext": {
-                    "name": field_name
-                },
-                "validation": validation_rules
-            }
-            if field_value and field_value.strip():
-                field_obj["value"] = field_value.strip()
-        elif field_type == "email":
-            field_obj = {
-                "type": "text-input",
-                "id": self.next_id(),
-                "label": label,
-                "styles": None,
-                "mask": None,
-                "codeContext": {
-                    "name": field_name
-                },
-                "placeholder": "example@example.com",
-                "inputType": "email",
-                "validation": validation_rules
-            }
-            if field_value and field_value.strip():
-                field_obj["value"] = field_value.strip()
-        elif field_type == "phone":
-            field_obj = {
-                "type": "text-input",
-                "id": self.next_id(),
-                "label": label,
-                "styles": None,
-                "mask": "(###) ###-####",
-                "codeContext": {
-                    "name": field_name
-                },
-                "placeholder": "(123) 456-7890",
-                "inputType": "tel",
-                "validation": validation_rules
-            }
-            if field_value and field_value.strip():
-                field_obj["value"] = field_value.strip()
-        elif field_type == "address":
-            field_obj = {
-                "type": "text-area",
-                "id": self.next_id(),
-                "label": label,
-                "styles": None,
-                "codeContext": {
-                    "name": field_name
-                },
-                "placeholder": "Street address",
-                "validation": validation_rules
-            }
-            if field_value and field_value.strip():
-                field_obj["value"] = field_value.strip()
-        elif field_type == "file":
-            field_obj = {
-                "type": "file",
-                "id": self.next_id(),
-                "label": label,
-                "styles": None,
-                "codeContext": {
-                    "name": field_name
-                },
-                "accept": field_attributes.get('mediatype', '*/*'),
-                "multiple": False,
-                "maxSize": None,  # Can be set from mapping if needed
-                "validation": validation_rules
-            }
-            if field_value:
-                field_obj["value"] = field_value
-            if field_attributes.get('filename'):
-                field_obj["filename"] = field_attributes.get('filename')
-            if field_attributes.get('size'):
-                field_obj["size"] = field_attributes.get('size')
-        
+        builder = self._FIELD_BUILDERS.get(field_type)
+        if builder is not None:
+            field_obj = builder(self, field_name, field_value, field_attributes, label, validation_rules)
+
         # Apply any additional mappings
         if mapping:
             if mapping.get("required"):
@@ -808,17 +1060,11 @@ class OrbeonParser:
     
     def format_section_name(self, section_name):
         """Format section name for display"""
-        # Remove 'section-' prefix if it exists
-        if section_name.startswith("section-"):
-            section_name = section_name[len("section-"):]
-        
-        # Replace hyphens with spaces and capitalize each word
-        return " ".join(word.capitalize() for word in section_name.split("-"))
+        return _format_section_name(section_name)
     
     def format_field_name(self, field_name):
         """Format field name for display"""
-        # Replace hyphens with spaces and capitalize each word
-        return " ".join(word.capitalize() for word in field_name.split("-"))
+        return _format_field_name(field_name)
 
     def extract_dropdown_options(self, field_elem):
         """Extract dropdown options from field element"""
@@ -826,13 +1072,13 @@ class OrbeonParser:
             options = []
             
             # First check if the field element has items directly in the form instance
-            field_instance = self.form_instance.find(f".//{field_elem.tag}", self.namespaces)
+            field_instance = self._find(self.form_instance, f".//{field_elem.tag}")
             if field_instance is not None:
-                items = field_instance.findall("item", self.namespaces)
+                items = self._findall(field_instance, "item")
                 if items:
                     for item in items:
-                        label = item.find("label", self.namespaces)
-                        value = item.find("value", self.namespaces)
+                        label = self._find(item, "label")
+                        value = self._find(item, "value")
                         if label is not None and label.text:
                             options.append({
                                 "text": label.text.strip(),
@@ -842,15 +1088,15 @@ class OrbeonParser:
                     return options
             
             # If no items found in form instance, look in the resources instance
-            resources = self.root.find(".//xf:instance[@id='fr-form-resources']", self.namespaces)
+            resources = self._find(self.root, ".//xf:instance[@id='fr-form-resources']")
             if resources is not None:
                 # Find the field's resource section
-                field_resource = resources.find(f".//{field_elem.tag}", self.namespaces)
+                field_resource = self._find(resources, f".//{field_elem.tag}")
                 if field_resource is not None:
                     # Look for items in the resource section
-                    for item in field_resource.findall(".//item", self.namespaces):
-                        label = item.find("label", self.namespaces)
-                        value = item.find("value", self.namespaces)
+                    for item in self._findall(field_resource, ".//item"):
+                        label = self._find(item, "label")
+                        value = self._find(item, "value")
                         if label is not None and label.text:
                             options.append({
                                 "text": label.text.strip(),
@@ -866,16 +1112,15 @@ class OrbeonParser:
         """Extract label from form resources"""
         try:
             # Find the field's resource section
-            field_resource = self.form_resources.find(f".//{field_name}", self.namespaces)
+            field_resource = self._find(self.form_resources, f".//{field_name}")
             if field_resource is not None:
                 # Look for label element
-                label_elem = field_resource.find("label", self.namespaces)
+                label_elem = self._find(field_resource, "label")
                 if label_elem is not None and label_elem.text:
                     # If label contains HTML, extract text content
                     if "<div>" in label_elem.text:
                         # Remove HTML tags and get text content
-                        import re
-                        text = re.sub('<[^<]+?>', '', label_elem.text)
+                        text = _HTML_TAG_RE.sub('', label_elem.text)
                         return text.strip()
                     return label_elem.text.strip()
             return None
@@ -886,9 +1131,9 @@ class OrbeonParser:
     def get_field_hint(self, field_name):
         """Extract hint from form resources"""
         try:
-            field_resource = self.form_resources.find(f".//{field_name}", self.namespaces)
+            field_resource = self._find(self.form_resources, f".//{field_name}")
             if field_resource is not None:
-                hint_elem = field_resource.find("hint", self.namespaces)
+                hint_elem = self._find(field_resource, "hint")
                 if hint_elem is not None and hint_elem.text:
                     return hint_elem.text.strip()
             return None
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 import argparse
-import json
 import os
 import sys
 import logging
@@ -12,6 +11,10 @@ from filename_generator import generate_filename
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Output JSON is machine-consumed, so it is written compact by default;
+# set ADZE_PRETTY_JSON=1 to get indented files for manual inspection
+PRETTY_JSON = os.getenv("ADZE_PRETTY_JSON") == "1"
+
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description='Convert Orbeon XML form files to JSON')
@@ -69,8 +72,8 @@ def convert_xml_to_json(input_path, mapping_path, output_path=None):
         
         # Write output to file
         logger.info(f"Writing output to {output_path}")
-        with open(output_path, 'w') as f:
-            json.dump(output_json, f, indent=4)
+        with open(output_path, 'wb') as f:
+            f.write(parser.to_json_bytes(pretty=PRETTY_JSON))
         
         logger.info(f"Conversion completed successfully! Output saved to {output_path}")
         return True
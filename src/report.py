@@ -1,10 +1,14 @@
 import json
 import logging
 import os
+
+try:
+    # orjson serializes large reports several times faster than stdlib json
+    import orjson
+except ImportError:
+    orjson = None
 from src.filename_generator import generate_filename
 
-# ✅ Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class Report:
@@ -52,6 +56,15 @@ class Report:
         self.data["manual_intervention_needed"].append(entry)
         self.total_manual_intervention += 1
 
+    def __enter__(self):
+        """Allow use as a context manager so the single write is not forgotten."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Flush the buffered report exactly once on exit."""
+        self.save_report()
+        return False
+
     def save_report(self):
         """Writes the final report to a JSON file (only once)."""
         total_fields = self.total_success + self.total_errors + self.total_manual_intervention
@@ -72,8 +85,12 @@ class Report:
             "manual_intervention_needed": self.data["manual_intervention_needed"]
         }
 
-        with open(self.report_file, "w", encoding="utf-8") as file:
-            json.dump(final_report, file, indent=4)
+        if orjson is not None:
+            with open(self.report_file, "wb") as file:
+                file.write(orjson.dumps(final_report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self.report_file, "w", encoding="utf-8") as file:
+                json.dump(final_report, file, indent=4)
 
         logger.info(f"✅ Report successfully saved: {self.report_file}")
 
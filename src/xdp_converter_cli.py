@@ -4,7 +4,6 @@ import os
 import time
 import subprocess
 import argparse
-import json
 import sys
 import logging
 from datetime import datetime
@@ -23,6 +22,10 @@ import platform
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Output JSON is machine-consumed, so it is written compact by default;
+# set ADZE_PRETTY_JSON=1 to get indented files for manual inspection
+PRETTY_JSON = os.getenv("ADZE_PRETTY_JSON") == "1"
+
 def get_latest_report():
     """Fetch the most recent report file from REPORT_DIR."""
     report_files = sorted(Path(REPORT_DIR).glob("*.json"), key=os.path.getmtime, reverse=True)
@@ -100,8 +103,8 @@ def convert_xml_to_json(input_path, mapping_path, output_path=None):
         
         # Write output to file
         logger.info(f"Writing output to {output_path}")
-        with open(output_path, 'w') as f:
-            json.dump(output_json, f, indent=4)
+        with open(output_path, 'wb') as f:
+            f.write(parser.to_json_bytes(pretty=PRETTY_JSON))
         
         logger.info(f"Conversion completed successfully! Output saved to {output_path}")
         return True
@@ -1,16 +1,23 @@
 # -*- coding: utf-8 -*-
 
 import argparse
+import concurrent.futures
 import logging
 import sys
 import os
 import time
 import json
 from typing import Any, Optional, Dict, List
+
+try:
+    # orjson's Rust encoder is several times faster than stdlib json with
+    # indentation; fall back to json when it is not installed
+    import orjson
+except ImportError:
+    orjson = None
 from xml_converter_class import XDPParser
 from filename_generator import generate_filename
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 # Dynamically resolve project root and default mapping file path
@@ -18,6 +25,10 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, ".."))
 DEFAULT_MAPPING_FILE = os.path.join(PROJECT_ROOT, "xml_mapping.json")
 
+# Output JSON is machine-consumed, so it is written compact by default;
+# set ADZE_PRETTY_JSON=1 to get indented files for manual inspection
+PRETTY_JSON = os.getenv("ADZE_PRETTY_JSON") == "1"
+
 class XDPConverter:
     """Class for converting XDP files to JSON format"""
     
@@ -31,7 +42,7 @@ class XDPConverter:
         self.mapping_file = mapping_file or DEFAULT_MAPPING_FILE
         
         if not os.path.exists(self.mapping_file):
-            logger.error(f"Mapping file not found: {self.mapping_file}")
+            logger.error("Mapping file not found: %s", self.mapping_file)
             raise FileNotFoundError(f"Mapping file not found: {self.mapping_file}")
     
     def parse_xdp_to_json(self, file_path):
@@ -48,7 +59,7 @@ class XDPConverter:
             parser = XDPParser(file_path, self.mapping_file)
             return parser.parse()
         except Exception as e:
-            logger.error(f"Error processing XDP: {e}")
+            logger.error("Error processing XDP: %s", e)
             return None
     
     def process_file(self, xdp_file: str, output_file: Optional[str] = None) -> bool:
@@ -63,16 +74,16 @@ class XDPConverter:
             True if conversion was successful, False otherwise
         """
         if not os.path.exists(xdp_file):
-            logger.error(f"XDP file not found: {xdp_file}")
+            logger.error("XDP file not found: %s", xdp_file)
             return False
         
         try:
-            logger.info(f"Processing file: {xdp_file}")
+            logger.info("Processing file: %s", xdp_file)
             # Convert the XDP to JSON
             json_data = self.parse_xdp_to_json(xdp_file)
 
             if not json_data:
-                logger.warning(f"Conversion failed: {xdp_file} (Empty JSON)")
+                logger.warning("Conversion failed: %s (Empty JSON)", xdp_file)
                 return False
             
             # Generate unique output filename if not provided
@@ -80,13 +91,24 @@ class XDPConverter:
                 output_file = generate_filename(xdp_file, "output")
             
             # Write the JSON output to file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=4, ensure_ascii=False)
+            if orjson is not None:
+                options = orjson.OPT_INDENT_2 if PRETTY_JSON else 0
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(json_data, option=options))
+            else:
+                # Serialize to one string first; json.dump's chunked writes
+                # through the text layer are slower than a single f.write
+                if PRETTY_JSON:
+                    payload = json.dumps(json_data, indent=4, ensure_ascii=False)
+                else:
+                    payload = json.dumps(json_data, separators=(",", ":"), ensure_ascii=False)
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    f.write(payload)
             
-            logger.info(f"Successfully converted {xdp_file} to {output_file}")
+            logger.info("Successfully converted %s to %s", xdp_file, output_file)
             return True 
         except Exception as e:
-            logger.error(f"Failed to process {xdp_file}: {e}")
+            logger.error("Failed to process %s: %s", xdp_file, e)
             return False
     
     def process_directory(self, input_dir: str, output_dir: str) -> int:
@@ -101,23 +123,34 @@ class XDPConverter:
             Number of files processed successfully
         """
         if not os.path.isdir(input_dir):
-            logger.error(f"Input directory not found: {input_dir}")
+            logger.error("Input directory not found: %s", input_dir)
             return 0
 
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
-        files_processed = 0
-        for filename in os.listdir(input_dir):
-            if filename.lower().endswith('.xdp'):
-                input_file = os.path.join(input_dir, filename)
-                # Use generate_filename for each file in the directory
-                output_file = generate_filename(input_file, "output")
-                
-                if self.process_file(input_file, output_file):
-                    files_processed += 1
-
-        logger.info(f"Processed {files_processed} XDP files")
+        # Build the job list up front so the files can be converted in parallel
+        jobs = []
+        # scandir hands back name and path in one pass without a stat per entry
+        with os.scandir(input_dir) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith('.xdp'):
+                    # Use generate_filename for each file in the directory
+                    output_file = generate_filename(entry.path, "output")
+                    jobs.append((self.mapping_file, entry.path, output_file))
+
+        if len(jobs) > 1:
+            # Each XDP is independent, so fan the work out across processes;
+            # parsing, regex transforms and JSON encoding are all CPU-bound
+            workers = os.cpu_count() or 1
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                chunksize = max(1, len(jobs) // (4 * workers))
+                results = list(executor.map(_convert_one, jobs, chunksize=chunksize))
+            files_processed = sum(1 for result in results if result)
+        else:
+            files_processed = sum(1 for job in jobs if _convert_one(job))
+
+        logger.info("Processed %d XDP files", files_processed)
         return files_processed
     
     def watch_directory(self, input_dir: str, output_dir: str):
@@ -132,52 +165,73 @@ class XDPConverter:
         input_dir = os.path.normpath(input_dir)
         output_dir = os.path.normpath(output_dir)
         
-        logger.info(f"Watching directory: {input_dir}")
+        logger.info("Watching directory: %s", input_dir)
 
         try:
             while True:
-                for filename in os.listdir(input_dir):
-                    if filename.endswith(".xdp"):
-                        file_path = os.path.normpath(os.path.join(input_dir, filename))
-                        last_modified = os.path.getmtime(file_path)
+                with os.scandir(input_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".xdp"):
+                            file_path = os.path.normpath(entry.path)
+                            # entry.stat() reuses the directory-scan data
+                            # instead of issuing a fresh stat per poll
+                            last_modified = entry.stat().st_mtime
 
-                        if filename not in processed_files or processed_files[filename] != last_modified:
-                            logger.info(f"New or modified file detected: {file_path}")
+                            if entry.name not in processed_files or processed_files[entry.name] != last_modified:
+                                logger.info("New or modified file detected: %s", file_path)
 
-                            # Use generate_filename for watched files
-                            output_file = generate_filename(file_path, "output")
+                                # Use generate_filename for watched files
+                                output_file = generate_filename(file_path, "output")
 
-                            if self.process_file(file_path, output_file):
-                                processed_files[filename] = last_modified
+                                if self.process_file(file_path, output_file):
+                                    processed_files[entry.name] = last_modified
 
                 time.sleep(5)
         except KeyboardInterrupt:
             logger.info("Watch mode stopped by user.")
         except Exception as e:
-            logger.error(f"Error in watch mode: {e}")
+            logger.error("Error in watch mode: %s", e)
+
+# One converter per mapping file (per process); repeated calls reuse the
+# instance instead of re-validating the mapping path each time
+_CONVERTERS: Dict[str, XDPConverter] = {}
+
+def _get_converter(mapping_file: Optional[str] = None) -> XDPConverter:
+    """Return a cached XDPConverter for the given mapping file."""
+    key = mapping_file or DEFAULT_MAPPING_FILE
+    converter = _CONVERTERS.get(key)
+    if converter is None:
+        converter = XDPConverter(mapping_file)
+        _CONVERTERS[key] = converter
+    return converter
+
+def _convert_one(job):
+    """Convert a single XDP file; module-level so it is picklable for workers."""
+    mapping_file, input_file, output_file = job
+    return _get_converter(mapping_file).process_file(input_file, output_file)
 
 # For backward compatibility, keep the original functions that use the new class
 def parse_xdp_to_json(file_path, mapping_file=None):
     """Main function to convert XDP to JSON"""
-    converter = XDPConverter(mapping_file)
-    return converter.parse_xdp_to_json(file_path)
+    return _get_converter(mapping_file).parse_xdp_to_json(file_path)
 
 def process_file(xdp_file: str, output_file: Optional[str] = None, mapping_file: Optional[str] = None) -> bool:
     """Process a single XDP file and output JSON."""
-    converter = XDPConverter(mapping_file)
-    return converter.process_file(xdp_file, output_file)
+    return _get_converter(mapping_file).process_file(xdp_file, output_file)
 
 def process_directory(input_dir: str, output_dir: str, mapping_file: Optional[str] = None) -> None:
     """Process all XDP files in a directory."""
-    converter = XDPConverter(mapping_file)
-    converter.process_directory(input_dir, output_dir)
+    _get_converter(mapping_file).process_directory(input_dir, output_dir)
 
 def watch_directory(input_dir: str, output_dir: str, mapping_file: Optional[str] = None):
     """Watches for new XDP files and triggers process_file() when they appear."""
-    converter = XDPConverter(mapping_file)
-    converter.watch_directory(input_dir, output_dir)
+    _get_converter(mapping_file).watch_directory(input_dir, output_dir)
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script; importers keep their own
+    # handler setup untouched
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
     parser = argparse.ArgumentParser(description='Convert XDP to JSON.')
     parser.add_argument('-f', type=str, help='Path to the XDP file')
     parser.add_argument('-m', type=str, help='Path to the XML mapping file')
@@ -197,7 +251,7 @@ if __name__ == "__main__":
 
     # Validate arguments
     if not os.path.exists(mapping_file):
-        logger.error(f"Mapping file not found: {mapping_file}")
+        logger.error("Mapping file not found: %s", mapping_file)
         sys.exit(1)
     
     if not args.f and not args.input_dir:
@@ -226,7 +280,7 @@ if __name__ == "__main__":
         logger.info("XML conversion " + ("successful" if result else "failed"))
 
     if args.watch and args.input_dir:
-        logger.info(f"Watch mode enabled. Monitoring directory: {args.input_dir}")
+        logger.info("Watch mode enabled. Monitoring directory: %s", args.input_dir)
         converter.watch_directory(args.input_dir, args.output_dir)
 
 
@@ -1,10 +1,69 @@
-import xml.etree.ElementTree as ET
+try:
+    # Prefer lxml's C-backed parser when available; it is markedly faster
+    # than the stdlib ElementTree on multi-MB XDP forms.
+    from lxml import etree as ET
+    _HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAVE_LXML = False
+import functools
 import json
 import os
-import uuid
-from datetime import datetime
+import re
+import sys
+from datetime import datetime, timezone
+
+try:
+    # Same optional dependency the writers use; decodes mapping JSON natively
+    import orjson
+except ImportError:
+    orjson = None
 from src.report import Report
 
+# Precompiled patterns for label generation and script conversion; compiling
+# per call thrashes re's internal cache on large batch runs
+_CAMEL_WORD_RE = re.compile('([A-Z][a-z]+)')
+_CAPS_RUN_RE = re.compile('([A-Z]+)')
+_NAME_SEP_RE = re.compile('[-_]')
+_FIELD_REF_RE = re.compile(r'(\w+)\.')
+
+# Attributes worth recording in breadcrumb paths; frozenset membership is a
+# single hash probe instead of a list scan on every attribute of every node
+_BREADCRUMB_ATTRS = frozenset(['name', 'type', 'ref', 'shape', 'contentType'])
+_RICHTEXT_SKIP_TAGS = frozenset(['style', 'xfa-spacerun'])
+
+# Parsed mapping files keyed by (path, mtime); batch runs build one parser
+# per document and should not re-read and re-decode the same mapping JSON
+_MAPPING_CACHE = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _qname(uri, local):
+    """Build a Clark-notation tag, shared across parser instances."""
+    return "{" + uri + "}" + local
+
+
+@functools.lru_cache(maxsize=256)
+def _localname(tag):
+    """Strip the Clark-notation namespace from a tag (no-op without one).
+
+    XDP documents draw tags from a tiny alphabet and the parser interns
+    them, so the cache hits by identity after the first few elements. The
+    result is interned too: downstream == comparisons and dict lookups
+    resolve by pointer instead of character scans.
+    """
+    return sys.intern(tag.rpartition('}')[2])
+
+
+@functools.lru_cache(maxsize=4096)
+def _name_to_label(field_name):
+    """Convert a camelCase/snake_case field name to a display label.
+
+    Field names repeat heavily across forms, so the result is memoized.
+    """
+    label = _CAMEL_WORD_RE.sub(r' \1', _CAPS_RUN_RE.sub(r' \1', field_name)).strip()
+    return ' '.join(word.capitalize() for word in _NAME_SEP_RE.split(label))
+
 class XDPParser:
     def __init__(self, xml_filename, mapping_file=None):
         try:
@@ -17,19 +76,52 @@ class XDPParser:
                 mapping_file = os.path.join(project_root, "xml_mapping.json")  # Construct full path
 
             self.mapping_file = mapping_file
-            self.breadcrumb = ""
+            self._crumbs = []  # stack of "<tag attrs>" tokens, joined lazily
+            self._crumb_len = 0  # running character total of the stack
             self.id_counter = 1
             self.mapping = self.load_mapping_file()
+            # Hoisted once here; find_mapping_for_path runs per field and
+            # should not re-fetch (or raise on a missing mapping) every call
+            self._mappings = self.mapping.get("mappings", []) if self.mapping else []
+            # Exact-match index consulted before the fuzzy scan; keyed by the
+            # normalized xmlPath so breadcrumb paths hit without scoring
+            self._mapping_by_path = {}
+            for m in self._mappings:
+                xml_path = m.get("xmlPath", "")
+                self._mapping_by_path.setdefault(xml_path, m)
+                self._mapping_by_path.setdefault(self.normalize_path(xml_path), m)
             self.namespaces = None
+            self._xpath_cache = {}  # expression string -> compiled XPath (lxml only)
+            self._path_parts_cache = {}  # path string -> [(tag, attrs), ...]
             self.javascript_section = {}  # Store JavaScript methods
 
-            # Parse the XML file
-            self.tree = ET.parse(xml_filename)
+            # Parse the XML file (lxml raises OSError on missing files, so
+            # check explicitly to keep the stdlib FileNotFoundError behaviour)
+            if not os.path.exists(xml_filename):
+                raise FileNotFoundError(f"XML file {xml_filename} not found")
+            if _HAVE_LXML:
+                # collect_ids=False skips building the xml:id hash (XDP forms
+                # carry thousands of ids we never look up); huge_tree lifts
+                # libxml2's depth/size limits for the largest forms.
+                # Comments and PIs are stripped so the tree matches what the
+                # stdlib parser produces - lxml otherwise yields them during
+                # iteration with non-string tags that break tag handling.
+                parser = ET.XMLParser(collect_ids=False, huge_tree=True,
+                                      remove_comments=True, remove_pis=True)
+                self.tree = ET.parse(xml_filename, parser)
+            else:
+                self.tree = ET.parse(xml_filename)
             self.root = self.tree.getroot()
             self.namespaces = self.extract_namespaces()
+            # Clark-notation tag for the occur probe in process_subform; a
+            # direct child find on a literal tag stays in C the whole way
+            template_uri = self.namespaces["template"]
+            self._occur_tag = _qname(template_uri, "occur")
+            self._ui_tag = _qname(template_uri, "ui")
+            self._bind_tag = _qname(template_uri, "bind")
 
             # Find the root subform
-            self.root_subform = self.root.find(".//template:subform", self.namespaces)
+            self.root_subform = self._find(self.root, ".//template:subform")
 
             # Output JSON structure
             self.output_json = self.create_output_structure()
@@ -45,31 +137,63 @@ class XDPParser:
             if not os.path.exists(self.mapping_file):
                 raise FileNotFoundError(f"Mapping file {self.mapping_file} not found")
             
-            with open(self.mapping_file, 'r') as f:
-                return json.load(f)
+            # The mtime in the key invalidates the cache if the file changes
+            cache_key = (self.mapping_file, os.path.getmtime(self.mapping_file))
+            mapping = _MAPPING_CACHE.get(cache_key)
+            if mapping is None:
+                if orjson is not None:
+                    with open(self.mapping_file, 'rb') as f:
+                        mapping = orjson.loads(f.read())
+                else:
+                    with open(self.mapping_file, 'r') as f:
+                        mapping = json.load(f)
+                _MAPPING_CACHE[cache_key] = mapping
+            return mapping
         except Exception as e:
             print(f"Error loading mapping file: {e}")
             return None
     
+    def _xp(self, expr):
+        """Return a compiled XPath object for expr, cached per instance."""
+        xp = self._xpath_cache.get(expr)
+        if xp is None:
+            xp = ET.XPath(expr, namespaces=self.namespaces)
+            self._xpath_cache[expr] = xp
+        return xp
+
+    def _findall(self, elem, expr):
+        """findall that reuses compiled XPath objects when lxml is available."""
+        if _HAVE_LXML:
+            return self._xp(expr)(elem)
+        return elem.findall(expr, self.namespaces)
+
+    def _find(self, elem, expr):
+        """find that reuses compiled XPath objects when lxml is available."""
+        if _HAVE_LXML:
+            results = self._xp(expr)(elem)
+            return results[0] if results else None
+        return elem.find(expr, self.namespaces)
+
     def extract_namespaces(self):
         try:
             """Extract namespace mappings from XML document"""
             namespaces = {}
-            
-            for elem in self.root.iter():
-                if '}' in elem.tag:
-                    uri = elem.tag.split('}')[0].strip('{')
-                    for attr_name in elem.attrib:
-                        if '}' in attr_name:
-                            prefix = attr_name.split('}')[1].split(':')[0]
-                            namespaces[prefix] = uri
-                            break
-                    else:
-                        if 'adobe.com/xdp' in uri:
-                            namespaces['xdp'] = uri
-                        elif 'xfa-template' in uri:
-                            namespaces['template'] = uri
-            
+
+            # Read declarations straight from the parser's start-ns events:
+            # xmlns attributes all live near the top of an XDP, so this sees
+            # a handful of header events instead of walking the built tree
+            for _, (prefix, uri) in ET.iterparse(self.xml_filename, events=("start-ns",)):
+                if 'adobe.com/xdp' in uri:
+                    namespaces['xdp'] = uri
+                elif 'xfa-template' in uri:
+                    namespaces['template'] = uri
+                elif prefix:
+                    namespaces.setdefault(prefix, uri)
+
+                # Stop once both required namespaces are known
+                if 'xdp' in namespaces and 'template' in namespaces:
+                    break
+
             # Return default namespaces if none found
             if not namespaces:
                 namespaces = {
@@ -96,63 +220,52 @@ class XDPParser:
             if element is not None and hasattr(element, 'attrib'):
                 for key, value in element.attrib.items():
                     # Only include certain relevant attributes
-                    if key in ['name', 'type', 'ref', 'shape', 'contentType']:
+                    if key in _BREADCRUMB_ATTRS:
                         # Remove namespace prefix from attribute if present
                         key = key.split("}")[-1] if "}" in key else key
                         tag_with_attrs += f" {key}=\"{value}\""
             
             tag_with_attrs += ">"
-            self.breadcrumb += tag_with_attrs
-            
-            # Keep breadcrumb from growing too large
-            if len(self.breadcrumb) > 200:
-                # Keep only the last 200 characters but ensure we don't break in middle of a tag
-                truncated = self.breadcrumb[-200:]
-                # Find first complete opening tag
-                first_tag = truncated.find("<")
-                if first_tag >= 0:
-                    self.breadcrumb = truncated[first_tag:]
+            # Push onto the token stack; the string form is only built when
+            # get_breadcrumb is called, so descent costs O(1) per element
+            # instead of re-copying the whole path
+            self._crumbs.append(tag_with_attrs)
+            self._crumb_len += len(tag_with_attrs)
+            
+            # Keep breadcrumb from growing too large: drop whole tokens from
+            # the front once the joined length would exceed 200 characters
+            while self._crumb_len > 200 and len(self._crumbs) > 1:
+                self._crumb_len -= len(self._crumbs.pop(0))
         except Exception as e:
             print(f"Error adding breadcrumb: {e}")
     
     def remove_breadcrumb(self, tag):
         try:
             """Remove the last element tag from breadcrumb"""
-            # Find the last occurrence of a tag that starts with the given name
-            last_index = -1
+            # Find the last token that starts with the given name and drop it
+            # together with everything pushed after it
             tag_start = f"<{tag}"
-            
-            # Look for the tag with any attributes
-            i = self.breadcrumb.rfind(tag_start)
-            while i >= 0:
-                tag_end = self.breadcrumb.find(">", i)
-                if tag_end >= 0:
-                    last_index = i
+            for i in range(len(self._crumbs) - 1, -1, -1):
+                if self._crumbs[i].startswith(tag_start):
+                    self._crumb_len -= sum(len(token) for token in self._crumbs[i:])
+                    del self._crumbs[i:]
                     break
-                i = self.breadcrumb.rfind(tag_start, 0, i)
-            
-            if last_index >= 0:
-                self.breadcrumb = self.breadcrumb[:last_index]
         except Exception as e:
             print(f"Error removing breadcrumb: {e}")
     
     def get_breadcrumb(self):
         try:
             """Get current normalized breadcrumb path"""
-            return self.normalize_path(self.breadcrumb)
+            return self.normalize_path("".join(self._crumbs))
         except Exception as e:
             print(f"Error getting breadcrumb: {e}")
             return ""
     
     def next_id(self):
-        try:
-            """Get next unique ID and increment counter"""
-            current_id = str(self.id_counter)
-            self.id_counter += 1
-            return current_id
-        except Exception as e:
-            print(f"Error generating next ID: {e}")
-            return str(uuid.uuid4())
+        """Get next unique ID and increment counter"""
+        current_id = str(self.id_counter)
+        self.id_counter += 1
+        return current_id
     
     def normalize_path(self, path):
         """Normalize an XML path for comparison by removing extra spaces and normalizing separators"""
@@ -169,16 +282,26 @@ class XDPParser:
             print(f"Error normalizing path: {e}")
             return path
 
+    def _prepare_path(self, path):
+        """Normalize a path and pre-split its components into (tag, attrs) pairs.
+
+        Results are cached: mapping xmlPaths are compared against every field
+        and breadcrumb paths repeat across sibling elements, so each distinct
+        path is normalized and tokenized only once per parse.
+        """
+        cached = self._path_parts_cache.get(path)
+        if cached is None:
+            normalized = self.normalize_path(path)
+            cached = [self.split_tag_and_attrs(part) for part in normalized.split("/")]
+            self._path_parts_cache[path] = cached
+        return cached
+
     def path_similarity(self, path1, path2):
         """Calculate similarity between two XML paths with improved hierarchy handling"""
         try:
-            # Normalize both paths
-            path1 = self.normalize_path(path1)
-            path2 = self.normalize_path(path2)
-            
-            # Split paths into components
-            parts1 = path1.split("/")
-            parts2 = path2.split("/")
+            # Normalize and tokenize both paths (cached)
+            parts1 = self._prepare_path(path1)
+            parts2 = self._prepare_path(path2)
             
             # Calculate matching score with position weighting
             matches = 0
@@ -191,9 +314,8 @@ class XDPParser:
                 position_weight = 1 + (i / max_length)
                 total_weight += position_weight
                 
-                # Extract tag and attributes
-                tag1, attrs1 = self.split_tag_and_attrs(parts1[i])
-                tag2, attrs2 = self.split_tag_and_attrs(parts2[i])
+                tag1, attrs1 = parts1[i]
+                tag2, attrs2 = parts2[i]
                 
                 # Compare tags
                 if tag1 == tag2:
@@ -263,10 +385,16 @@ class XDPParser:
     def find_mapping_for_path(self, path):
         """Find mapping configuration for given path using fuzzy matching"""
         try:
+            # O(1) exact hit first; the scored scan below only runs for paths
+            # that need fuzzy matching
+            exact = self._mapping_by_path.get(path) or self._mapping_by_path.get(self.normalize_path(path))
+            if exact is not None:
+                return exact
+
             best_match = None
             best_score = 0.7  # Minimum similarity threshold
             
-            for mapping in self.mapping.get("mappings", []):
+            for mapping in self._mappings:
                 xml_path = mapping.get("xmlPath", "")
                 score = self.path_similarity(path, xml_path)
                 
@@ -286,14 +414,21 @@ class XDPParser:
             return None
     
     def create_output_structure(self):
+        # Stamp once up front; isoformat avoids a strftime format parse and
+        # keeps the success and error paths on the same timestamp. Taken in
+        # real UTC so the +00:00 offset is honest rather than stamped onto
+        # local time, matching the Orbeon converter.
+        last_modified = datetime.now(timezone.utc).isoformat(timespec="seconds")
         try:
             """Create the base output JSON structure"""
             # Extract form ID from filename (e.g. CFL04511 from CFL04511.xml)
             form_id = os.path.splitext(os.path.basename(self.xml_filename))[0]
 
             
-            # Find title text manually since contains() is not supported in ElementTree XPath
-            for text_elem in self.root.findall(".//template:text", self.namespaces):
+            # Find title text manually since contains() is not supported in ElementTree XPath.
+            # iterfind is lazy, so the walk stops at the first matching element
+            # instead of materializing every text node in the document.
+            for text_elem in self.root.iterfind(".//template:text", self.namespaces):
                 if text_elem.text and "Work Search" in text_elem.text:
                     form_title = text_elem.text
                     break
@@ -302,7 +437,7 @@ class XDPParser:
                 "version": None,
                 "ministry_id": self.mapping["constants"]["ministry_id"],
                 "id": None,
-                "lastModified": datetime.now().strftime("%Y-%m-%dT%H:%M:%S+00:00"),
+                "lastModified": last_modified,
                 "title": None,
                 "form_id": form_id,
                 "deployed_to": None,
@@ -323,7 +458,7 @@ class XDPParser:
                 "version": None,
                 "ministry_id": "0",
                 "id": None,
-                "lastModified": datetime.now().strftime("%Y-%m-%dT%H:%M:%S+00:00"),
+                "lastModified": last_modified,
                 "title": None,
                 "form_id": form_id,
                 "deployed_to": None,
@@ -363,31 +498,21 @@ class XDPParser:
     def process_master_pages(self):
         try:
             """Process pageSet elements (master pages)"""
-            pagesets = self.root.findall(".//template:pageSet", self.namespaces)
+            pagesets = self._findall(self.root, ".//template:pageSet")
             
             for pageset in pagesets:
                 # Find text elements in pageSet for header/footer info
-                for draw in pageset.findall(".//template:draw", self.namespaces):
+                for draw in self._findall(pageset, ".//template:draw"):
                     draw_name = draw.attrib.get("name", "generic_text_display")
                     
                     # Get the text value if available
                     text_value = None
-                    text_elem = draw.find(".//template:text", self.namespaces)
+                    text_elem = self._find(draw, ".//template:text")
                     if text_elem is not None and text_elem.text:
                         text_value = text_elem.text
                     
                     # Create text-info field
-                    text_field = {
-                        "type": "text-info",
-                        "id": self.next_id(),
-                        "label": None,
-                        "styles": None,
-                        "mask": None,
-                        "codeContext": {
-                            "name": None
-                        },
-                        "value": text_value,
-                    }
+                    text_field = self._make_text_info(None, None, text_value)
                     self.all_items.append(text_field)
                     self.Report.report_success(draw_name, 'text-info', text_value)
         except Exception as e:
@@ -397,27 +522,17 @@ class XDPParser:
         try:
             page_fields = []
             # Find text elements in pageSet for header/footer info
-            for draw in pageset.findall(".//template:draw", self.namespaces):
+            for draw in self._findall(pageset, ".//template:draw"):
                 draw_name = draw.attrib.get("name", "generic_text_display")
                 
                 # Get the text value if available
                 text_value = None
-                text_elem = draw.find(".//template:text", self.namespaces)
+                text_elem = self._find(draw, ".//template:text")
                 if text_elem is not None and text_elem.text:
                     text_value = text_elem.text
                 
                 # Create text-info field
-                text_field = {
-                    "type": "text-info",
-                    "id": self.next_id(),
-                    "label": None,
-                    "styles": None,
-                    "mask": None,
-                    "codeContext": {
-                        "name": None
-                    },
-                    "value": text_value,
-                }
+                text_field = self._make_text_info(None, None, text_value)
                 page_fields.append(text_field)
                 self.Report.report_success(draw_name, 'text-info', text_value)
             return page_fields
@@ -430,12 +545,12 @@ class XDPParser:
         try:
             """Process top-level elements in the main subform"""
             # First, check for any direct field or draw elements
-            for draw in self.root_subform.findall(".//template:draw", self.namespaces):
+            for draw in self._findall(self.root_subform, ".//template:draw"):
                 field = self.process_draw(draw)
                 if field:
                     self.all_items.append(field)
             
-            for field in self.root_subform.findall("./template:field", self.namespaces):
+            for field in self._findall(self.root_subform, "./template:field"):
                 field_obj = self.process_field(field)
                 if field_obj:
                     field_script = self.process_script(field)
@@ -447,19 +562,52 @@ class XDPParser:
                     self.all_items.append(field_obj)
             
             # Then process subforms (which become groups)
-            for subform in self.root_subform.findall("./template:subform", self.namespaces):
+            for subform in self._findall(self.root_subform, "./template:subform"):
                 group = self.process_subform(subform)
                 if group:
                     self.all_items.append(group)
             
             # Process exclusion groups (radio button groups)
-            for exclgroup in self.root_subform.findall("./template:exclGroup", self.namespaces):
+            for exclgroup in self._findall(self.root_subform, "./template:exclGroup"):
                 group = self.process_exclgroup(exclgroup)
                 if group:
                     self.all_items.append(group)
         except Exception as e:
             print(f"Error processing root elements: {e}")
     
+    # Prototype payloads for the draw path: copying a prototype dict is
+    # cheaper than re-evaluating the full literal per element. codeContext
+    # is replaced after the copy since dict.copy is shallow.
+    _TEXT_INPUT_TEMPLATE = {
+        "type": "text-input",
+        "id": None,
+        "label": None,
+        "styles": None,
+        "mask": None,
+        "codeContext": None,
+        "placeholder": None,
+        "inputType": "text",
+        "value": "",  # Ensure value is empty
+    }
+    _TEXT_INFO_TEMPLATE = {
+        "type": "text-info",
+        "id": None,
+        "label": None,
+        "styles": None,
+        "mask": None,
+        "codeContext": None,
+        "value": None,
+    }
+
+    def _make_text_info(self, name, label, value):
+        """Create a text-info item from the shared prototype."""
+        field_obj = self._TEXT_INFO_TEMPLATE.copy()
+        field_obj["id"] = self.next_id()
+        field_obj["label"] = label
+        field_obj["codeContext"] = {"name": name}
+        field_obj["value"] = value
+        return field_obj
+
     def process_draw(self, draw):
         try:
             """Process a draw element (usually text display or image)"""
@@ -473,7 +621,7 @@ class XDPParser:
             mapping = self.find_mapping_for_path(current_path)
             
             # Check for image content first
-            image_elem = draw.find(".//template:value/template:image", self.namespaces)
+            image_elem = self._find(draw, ".//template:value/template:image")
             if image_elem is not None and image_elem.attrib.get("contentType", "").startswith("image/"):
                 # Create image field object
                 field_obj = {
@@ -501,13 +649,13 @@ class XDPParser:
             text_value = None
             
             # First check for direct text value in value/text element
-            value_elem = draw.find(".//template:value/template:text", self.namespaces)
+            value_elem = self._find(draw, ".//template:value/template:text")
             if value_elem is not None and value_elem.text:
                 text_value = value_elem.text
             
             # Then check for text in exData
             if not text_value:
-                for exdata_elem in draw.findall(".//template:exData", self.namespaces):
+                for exdata_elem in self._findall(draw, ".//template:exData"):
                     if exdata_elem.attrib.get("contentType") == "text/html":
                         html_text = self.extract_text_from_exdata(exdata_elem)
                         if html_text:
@@ -524,13 +672,9 @@ class XDPParser:
                     label = text_value
                     text_value = None  # Don't use the same text as both label and value
             
-            # Check if this is a textEdit field
-            is_text_edit = False
-            ui_elem = draw.find(".//template:ui", self.namespaces)
-            if ui_elem is not None:
-                text_edit_elem = ui_elem.find(".//template:textEdit", self.namespaces)
-                if text_edit_elem is not None:
-                    is_text_edit = True
+            # Check if this is a textEdit field (single fused lookup instead
+            # of finding the ui element and then searching under it)
+            is_text_edit = self._find(draw, ".//template:ui//template:textEdit") is not None
             
             # Determine field type - use mapping if available
             field_type = "generic_text_display"
@@ -553,36 +697,17 @@ class XDPParser:
             
             # Create field object based on type
             if field_type == "text-input":
-                field_obj = {
-                    "type": "text-input",
-                    "id": self.next_id(),
-                    "label": text_value,  # Set text value as label
-                    "styles": None,
-                    "mask": None,
-                    "codeContext": {
-                        "name": draw_name
-                    },
-                    "placeholder": None,
-                    "inputType": "text",
-                    "value": ""  # Ensure value is empty
-                }
+                field_obj = self._TEXT_INPUT_TEMPLATE.copy()
+                field_obj["id"] = self.next_id()
+                field_obj["label"] = text_value  # Set text value as label
+                field_obj["codeContext"] = {"name": draw_name}
                 
                 # If this is a textEdit field with a default value, add it
                 if is_text_edit and text_value:
                     field_obj["value"] = ""  # Keep value empty even for textEdit fields
             else:
                 # Create text-info field
-                field_obj = {
-                    "type": "text-info",
-                    "id": self.next_id(),
-                    "label": label,
-                    "styles": None,
-                    "mask": None,
-                    "codeContext": {
-                        "name": draw_name
-                    },
-                    "value": text_value,
-                }
+                field_obj = self._make_text_info(draw_name, label, text_value)
             
             # Apply any additional mapping properties
             if mapping:
@@ -608,13 +733,13 @@ class XDPParser:
             label = None
             
             # Method 1: Direct caption
-            caption_elem = field.find(".//template:caption//template:text", self.namespaces)
+            caption_elem = self._find(field, ".//template:caption//template:text")
             if caption_elem is not None and caption_elem.text:
                 label = caption_elem.text.strip()
             
             # Method 2: Value text that looks like a label
             if not label:
-                value_elem = field.find(".//template:value//template:text", self.namespaces)
+                value_elem = self._find(field, ".//template:value//template:text")
                 if value_elem is not None and value_elem.text:
                     text = value_elem.text.strip()
                     # Check if this looks like a label (ends with :, all caps, etc)
@@ -626,9 +751,7 @@ class XDPParser:
                 field_name = field.attrib.get("name", "")
                 if field_name:
                     # Convert camelCase/snake_case to space-separated words
-                    import re
-                    label = re.sub('([A-Z][a-z]+)', r' \1', re.sub('([A-Z]+)', r' \1', field_name)).strip()
-                    label = ' '.join(word.capitalize() for word in re.split('[-_]', label))
+                    label = _name_to_label(field_name)
             
             return label
         except Exception as e:
@@ -647,8 +770,9 @@ class XDPParser:
             # Find mapping configuration for this field path
             mapping = self.find_mapping_for_path(current_path)
             
-            # Get UI element to determine field type
-            ui_elem = field.find("./template:ui", self.namespaces)
+            # Get UI element to determine field type (direct child probe on a
+            # precomputed Clark tag, no XPath evaluation)
+            ui_elem = field.find(self._ui_tag)
             if ui_elem is None:
                 self.remove_breadcrumb(field_name)
                 return None
@@ -660,249 +784,45 @@ class XDPParser:
                 return None
             
             ui_child = ui_children[0]
-            ui_tag = ui_child.tag.split('}')[-1] if '}' in ui_child.tag else ui_child.tag
+            ui_tag = _localname(ui_child.tag)
 
             # Get label using enhanced extraction
             label = self.extract_label(field)
             
             # Get help text if available
             help_text = None
-            help_elem = field.find("./template:assist/template:toolTip", self.namespaces)
+            help_elem = self._find(field, "./template:assist/template:toolTip")
             if help_elem is not None and help_elem.text:
                 help_text = help_elem.text
             
             # Get binding reference if available
             binding_ref = None
-            binding_elem = field.find("./template:bind", self.namespaces)
+            binding_elem = field.find(self._bind_tag)
             if binding_elem is not None and 'ref' in binding_elem.attrib:
                 binding_ref = binding_elem.attrib['ref']
             
             # Create appropriate field object based on UI type
             field_obj = None
             
-            # Apply mapping overrides if available
+            # Apply mapping overrides if available (unpack the mapping keys
+            # once instead of re-reading the dict in each branch below)
             field_type = None
+            mapping_required = None
+            mapping_validation = None
             if mapping:
                 field_type = mapping.get("fieldType")
+                mapping_required = mapping.get("required")
+                mapping_validation = mapping.get("validation")
                 # Apply other mapping configurations
-                if mapping.get("label"):
-                    label = mapping.get("label")
-            
-            # Create field object based on UI type
-            if ui_tag == "fileSelect":
-                field_obj = {
-                    "type": "file",
-                    "id": self.next_id(),
-                    "label": label,
-                    "styles": None,
-                    "codeContext": {
-                        "name": field_name
-                    },
-                    "accept": "*/*",
-                    "multiple": False,
-                    "maxSize": None,
-                    "validation": []
-                }
-                
-                # Add databinding if available
-                if binding_ref:
-                    field_obj["databindings"] = {"path": binding_ref}
-                    
-                    # Apply any dataSource mappings
-                    if mapping and mapping.get("dataSource"):
-                        field_obj["databindings"]["source"] = mapping.get("dataSource")
-            
-            elif ui_tag == "textEdit":
-                field_obj = {
-                    "type": field_type or "text-input",
-                    "id": self.next_id(),
-                    "label": label,
-                    "styles": None,
-                    "mask": None,
-                    "codeContext": {
-                        "name": None
-                    },
-                    "placeholder": None,
-                    "inputType": "text",
-                    "conditions": []
-                }
-                
-                # Check for special field types based on field name if no mapping found
-                if not field_type and ("area" in field_name.lower() or 
-                                    any(area in field_name.lower() for area in ["comment", "description", "notes"])):
-                    field_obj["type"] = "text-area"
-                
-                # Add databinding if available
-                if binding_ref:
-                    source = None
-                    if "Contact" in binding_ref:
-                        source = "Contact"
-                    elif "Service" in binding_ref:
-                        source = "Service Request"
-                        
-                    if source:
-                        field_obj["databindings"] = {
-                            "source": source,
-                            "path": binding_ref
-                        }
-                    else:
-                        field_obj["databindings"] = {
-                            "path": binding_ref
-                        }
-                        
-                    # Apply any dataSource mappings from the mapping file if present
-                    if mapping and mapping.get("dataSource"):
-                        field_obj["databindings"]["source"] = mapping.get("dataSource")
-            
-            elif ui_tag == "numericEdit":
-                field_obj = {
-                    "type": field_type or "text-input",
-                    "id": self.next_id(),
-                    "label": label,
-                    "styles": None,
-                    "codeContext": {
-                        "name": None
-                    },
-                    "value": None,
-                    "inputType": "number",
-                    "conditions": []
-                }
-                
-                if binding_ref:
-                    field_obj["databindings"] = {"path": binding_ref}
-                    
-                    # Apply any dataSource mappings
-                    if mapping and mapping.get("dataSource"):
-                        field_obj["databindings"]["source"] = mapping.get("dataSource")
-            
-            elif ui_tag == "dateTimeEdit":
-                # Extract the date format if available
-                date_format = "yyyy-MM-dd"  # Default format
-                format_elem = field.find("./template:format/template:picture", self.namespaces)
-                if format_elem is not None and format_elem.text:
-                    date_format = format_elem.text.lower().replace("yyyy", "Y").replace("dd", "d").replace("mm", "m")
-
-                field_obj = {
-                    "type": "date",
-                    "label": label,
-                    "id": self.next_id(),
-                    "fieldId": str(self.next_id()),
-                    "codeContext": {
-                        "name": None
-                    },
-                    "label": label,
-                    "placeholder": None,
-                    "mask": date_format,
-                    "conditions": []
-                }
-            
-            elif ui_tag == "button":
-                field_obj = {
-                    "type": "button",
-                    "id": self.next_id(),
-                    "label": label,
-                    "styles": None,
-                    "codeContext": {
-                        "name": None
-                    },
-                    "buttonType": "submit",
-                    "conditions": []
-                }
-            
-            elif ui_tag == "choiceList":
-                field_obj = {
-                    "id": self.next_id(),
-                    "mask": None,
-                    "size": "md",
-                    "type": "dropdown",
-                    "label": label if label else "Dropdown",
-                    "styles": None,
-                    "isMulti": False,
-                    "isInline": False,
-                    "direction": "bottom",
-                    "listItems": [],  # List of dropdown options
-                    "codeContext": {
-                        "name": field_name
-                    },
-                    "placeholder": "",
-                    "conditions": []
-                }
-                
-                # Extract items directly with their attributes using ElementTree's API
-                visible_items = []
-                saved_values = []
-                
-                # Get all items elements first
-                items_elements = field.findall("./template:items", self.namespaces)
-                for items_elem in items_elements:
-                    is_hidden = items_elem.get("presence") == "hidden"
-                    is_saved = items_elem.get("save") == "1"
-                    
-                    # Get text elements within this items element
-                    for text_elem in items_elem.findall("./template:text", self.namespaces):
-                        if is_saved:
-                            saved_values.append(text_elem)
-                        elif not is_hidden:
-                            visible_items.append(text_elem)
-
-                # Ensure correct mapping of labels and values
-                list_items = []
-                for index, item in enumerate(visible_items):
-                    value = saved_values[index].text if index < len(saved_values) else item.text
-                    if item.text:
-                        list_items.append({
-                            "text": item.text.strip(),
-                            "value": value.strip(),
-                            "name": value.strip()
-                        })
-
-                field_obj["listItems"] = list_items
-            
-            elif ui_tag == "checkButton":
-                field_obj = {
-                    "type": "checkbox",
-                    "id": self.next_id(),
-                    "label": label if label else "Checkbox",
-                    "webStyles": None,
-                    "pdfStyles": None,
-                    "mask": None,
-                    "codeContext": {
-                        "name": field_name
-                    },
-                    "databindings": {},
-                    "conditions": []
-                }
-
-                # Extract checkbox default value (1 = checked, 0 = unchecked)
-                value_elem = field.find("./template:value/template:integer", self.namespaces)
-                if value_elem is not None:
-                    field_obj["value"] = value_elem.text.strip() == "1"
-                    # Assign Data Bindings (source & path)
-                    binding_elem = field.find("./template:bind", self.namespaces)
-                    if binding_elem is not None and 'ref' in binding_elem.attrib:
-                        binding_ref = binding_elem.attrib['ref']
-                        field_obj["databindings"] = {
-                            "source": None,  # Adjust this if needed
-                            "path": binding_ref
-                        }
-            
-            elif ui_tag == "signature":
-                field_obj = {
-                    "id": self.next_id(),
-                    "mask": None,
-                    "type": "text-input",  # Overriding from "signature" to "text-input"
-                    "label": label if label else None,
-                    "styles": None,
-                    "inputType": "text",
-                    "codeContext": {
-                        "name": field_name.lower().replace(" ", "_")  # Ensuring name consistency
-                    },
-                    "customStyle": {
-                        "printColumns": "2"
-                    },
-                    "placeholder": "",
-                    "conditions": []
-                }
+                mapping_label = mapping.get("label")
+                if mapping_label:
+                    label = mapping_label
+            
+            # Create field object via the UI dispatch table (one dict
+            # lookup instead of a per-field if/elif ladder)
+            builder = self._UI_BUILDERS.get(ui_tag)
+            if builder is not None:
+                field_obj = builder(self, field, field_name, label, binding_ref, field_type, mapping)
 
             # Process any scripts and get conditions after field_obj is created
             if field_obj:
@@ -923,13 +843,12 @@ class XDPParser:
                 self.Report.report_success(field_obj["type"], 'text-info', field_obj["label"])
                 
                 # Apply any additional mappings to field_obj
-                if mapping:
-                    if mapping.get("required"):
-                        field_obj["required"] = mapping.get("required")
-                    if mapping.get("validation"):
-                        if "validation" not in field_obj:
-                            field_obj["validation"] = []
-                        field_obj["validation"].extend(mapping.get("validation", []))
+                if mapping_required:
+                    field_obj["required"] = mapping_required
+                if mapping_validation:
+                    if "validation" not in field_obj:
+                        field_obj["validation"] = []
+                    field_obj["validation"].extend(mapping_validation)
             else:
                 self.Report.report_error(field_name, 'text-info', field_name, "Error processing field element")
                 
@@ -942,6 +861,261 @@ class XDPParser:
                                     "Error processing field element")
             return None
     
+
+    def _build_file_select(self, field, field_name, label, binding_ref, field_type, mapping):
+        """Build a file upload field object"""
+        field_obj = {
+            "type": "file",
+            "id": self.next_id(),
+            "label": label,
+            "styles": None,
+            "codeContext": {
+                "name": field_name
+            },
+            "accept": "*/*",
+            "multiple": False,
+            "maxSize": None,
+            "validation": []
+        }
+
+        # Add databinding if available
+        if binding_ref:
+            field_obj["databindings"] = {"path": binding_ref}
+
+            # Apply any dataSource mappings
+            if mapping and mapping.get("dataSource"):
+                field_obj["databindings"]["source"] = mapping.get("dataSource")
+
+        return field_obj
+
+    # Prototypes for the two most common field builders; mutable slots
+    # (codeContext, conditions) are filled per field after the copy
+    _TEXT_EDIT_TEMPLATE = {
+        "type": None,
+        "id": None,
+        "label": None,
+        "styles": None,
+        "mask": None,
+        "codeContext": None,
+        "placeholder": None,
+        "inputType": "text",
+        "conditions": None,
+    }
+    _NUMERIC_EDIT_TEMPLATE = {
+        "type": None,
+        "id": None,
+        "label": None,
+        "styles": None,
+        "codeContext": None,
+        "value": None,
+        "inputType": "number",
+        "conditions": None,
+    }
+
+    def _build_text_edit(self, field, field_name, label, binding_ref, field_type, mapping):
+        """Build a text input (or text area) field object"""
+        field_obj = self._TEXT_EDIT_TEMPLATE.copy()
+        field_obj["type"] = field_type or "text-input"
+        field_obj["id"] = self.next_id()
+        field_obj["label"] = label
+        field_obj["codeContext"] = {"name": None}
+        field_obj["conditions"] = []
+
+        # Check for special field types based on field name if no mapping found
+        if not field_type and ("area" in field_name.lower() or
+                            any(area in field_name.lower() for area in ["comment", "description", "notes"])):
+            field_obj["type"] = "text-area"
+
+        # Add databinding if available
+        if binding_ref:
+            source = None
+            if "Contact" in binding_ref:
+                source = "Contact"
+            elif "Service" in binding_ref:
+                source = "Service Request"
+
+            if source:
+                field_obj["databindings"] = {
+                    "source": source,
+                    "path": binding_ref
+                }
+            else:
+                field_obj["databindings"] = {
+                    "path": binding_ref
+                }
+
+            # Apply any dataSource mappings from the mapping file if present
+            if mapping and mapping.get("dataSource"):
+                field_obj["databindings"]["source"] = mapping.get("dataSource")
+
+        return field_obj
+
+    def _build_numeric_edit(self, field, field_name, label, binding_ref, field_type, mapping):
+        """Build a numeric input field object"""
+        field_obj = self._NUMERIC_EDIT_TEMPLATE.copy()
+        field_obj["type"] = field_type or "text-input"
+        field_obj["id"] = self.next_id()
+        field_obj["label"] = label
+        field_obj["codeContext"] = {"name": None}
+        field_obj["conditions"] = []
+
+        if binding_ref:
+            field_obj["databindings"] = {"path": binding_ref}
+
+            # Apply any dataSource mappings
+            if mapping and mapping.get("dataSource"):
+                field_obj["databindings"]["source"] = mapping.get("dataSource")
+
+        return field_obj
+
+    def _build_date_time_edit(self, field, field_name, label, binding_ref, field_type, mapping):
+        """Build a date field object"""
+        # Extract the date format if available
+        date_format = "yyyy-MM-dd"  # Default format
+        format_elem = self._find(field, "./template:format/template:picture")
+        if format_elem is not None and format_elem.text:
+            date_format = format_elem.text.lower().replace("yyyy", "Y").replace("dd", "d").replace("mm", "m")
+
+        return {
+            "type": "date",
+            "label": label,
+            "id": self.next_id(),
+            "fieldId": str(self.next_id()),
+            "codeContext": {
+                "name": None
+            },
+            "placeholder": None,
+            "mask": date_format,
+            "conditions": []
+        }
+
+    def _build_button(self, field, field_name, label, binding_ref, field_type, mapping):
+        """Build a button field object"""
+        return {
+            "type": "button",
+            "id": self.next_id(),
+            "label": label,
+            "styles": None,
+            "codeContext": {
+                "name": None
+            },
+            "buttonType": "submit",
+            "conditions": []
+        }
+
+    def _build_choice_list(self, field, field_name, label, binding_ref, field_type, mapping):
+        """Build a dropdown field object with its list items"""
+        field_obj = {
+            "id": self.next_id(),
+            "mask": None,
+            "size": "md",
+            "type": "dropdown",
+            "label": label if label else "Dropdown",
+            "styles": None,
+            "isMulti": False,
+            "isInline": False,
+            "direction": "bottom",
+            "listItems": [],  # List of dropdown options
+            "codeContext": {
+                "name": field_name
+            },
+            "placeholder": "",
+            "conditions": []
+        }
+
+        # Extract items directly with their attributes using ElementTree's API
+        visible_items = []
+        saved_values = []
+
+        # Get all items elements first
+        items_elements = self._findall(field, "./template:items")
+        for items_elem in items_elements:
+            is_hidden = items_elem.get("presence") == "hidden"
+            is_saved = items_elem.get("save") == "1"
+
+            # Get text elements within this items element
+            for text_elem in self._findall(items_elem, "./template:text"):
+                if is_saved:
+                    saved_values.append(text_elem)
+                elif not is_hidden:
+                    visible_items.append(text_elem)
+
+        # Ensure correct mapping of labels and values
+        list_items = []
+        for index, item in enumerate(visible_items):
+            value = saved_values[index].text if index < len(saved_values) else item.text
+            if item.text:
+                list_items.append({
+                    "text": item.text.strip(),
+                    "value": value.strip(),
+                    "name": value.strip()
+                })
+
+        field_obj["listItems"] = list_items
+        return field_obj
+
+    def _build_check_button(self, field, field_name, label, binding_ref, field_type, mapping):
+        """Build a checkbox field object"""
+        field_obj = {
+            "type": "checkbox",
+            "id": self.next_id(),
+            "label": label if label else "Checkbox",
+            "webStyles": None,
+            "pdfStyles": None,
+            "mask": None,
+            "codeContext": {
+                "name": field_name
+            },
+            "databindings": {},
+            "conditions": []
+        }
+
+        # Extract checkbox default value (1 = checked, 0 = unchecked)
+        value_elem = self._find(field, "./template:value/template:integer")
+        if value_elem is not None:
+            field_obj["value"] = value_elem.text.strip() == "1"
+            # Assign Data Bindings (source & path)
+            binding_elem = field.find(self._bind_tag)
+            if binding_elem is not None and 'ref' in binding_elem.attrib:
+                binding_ref = binding_elem.attrib['ref']
+                field_obj["databindings"] = {
+                    "source": None,  # Adjust this if needed
+                    "path": binding_ref
+                }
+
+        return field_obj
+
+    def _build_signature(self, field, field_name, label, binding_ref, field_type, mapping):
+        """Build a signature field object (rendered as a text input)"""
+        return {
+            "id": self.next_id(),
+            "mask": None,
+            "type": "text-input",  # Overriding from "signature" to "text-input"
+            "label": label if label else None,
+            "styles": None,
+            "inputType": "text",
+            "codeContext": {
+                "name": field_name.lower().replace(" ", "_")  # Ensuring name consistency
+            },
+            "customStyle": {
+                "printColumns": "2"
+            },
+            "placeholder": "",
+            "conditions": []
+        }
+
+    # UI element tag -> builder; looked up once per field in process_field
+    _UI_BUILDERS = {
+        "fileSelect": _build_file_select,
+        "textEdit": _build_text_edit,
+        "numericEdit": _build_numeric_edit,
+        "dateTimeEdit": _build_date_time_edit,
+        "button": _build_button,
+        "choiceList": _build_choice_list,
+        "checkButton": _build_check_button,
+        "signature": _build_signature,
+    }
+
     def _clean_escape_characters(self, text):
         """Clean up escape characters in JavaScript text"""
         try:
@@ -974,26 +1148,21 @@ class XDPParser:
         """Process script tags and convert Adobe JavaScript to standard JavaScript"""
         try:
             # Look for direct script tags
-            script_tags = field.findall(".//template:script", self.namespaces)
+            script_tags = self._findall(field, ".//template:script")
             
             # Also look for scripts within event tags
-            event_tags = field.findall(".//template:event", self.namespaces)
+            event_tags = self._findall(field, ".//template:event")
             for event_tag in event_tags:
                 event_name = event_tag.attrib.get("activity", "initialize")
-                for script_tag in event_tag.findall(".//template:script", self.namespaces):
+                for script_tag in self._findall(event_tag, ".//template:script"):
                     script_tags.append((script_tag, event_name))
             
             field_id = field.attrib.get("name", f"field_{self.id_counter}")
             
-            # Check if this is a group field
-            is_group_field = False
-            group_id = None
-            parent = field.getparent() if hasattr(field, 'getparent') else None
-            if parent is not None and 'subform' in parent.tag:
-                is_group_field = True
-                group_id = parent.attrib.get("name", "").split('_')[0]
-                field_id = f"group_{group_id}_{field_id}"
-            
+            # Group prefixing via getparent() was gated on hasattr and never
+            # fired under the stdlib backend, so function names have always
+            # been plain <field>_<event>; keep that shape under lxml too so
+            # output does not depend on which XML backend is installed
             for script_item in script_tags:
                 # Handle both direct script tags and event script tuples
                 if isinstance(script_item, tuple):
@@ -1056,8 +1225,7 @@ class XDPParser:
             
             # Handle field references
             # Replace direct field references with document.getElementById calls
-            import re
-            field_refs = re.findall(r'(\w+)\.', script)
+            field_refs = _FIELD_REF_RE.findall(script)
             for ref in field_refs:
                 if ref != 'document':
                     # Check if this is a group field reference
@@ -1080,7 +1248,7 @@ class XDPParser:
         """Process global scripts in the root subform"""
         try:
             # Look for script tags in the root subform
-            script_tags = self.root_subform.findall(".//template:script", self.namespaces)
+            script_tags = self._findall(self.root_subform, ".//template:script")
             
             for script_tag in script_tags:
                 script_text = script_tag.text
@@ -1099,7 +1267,7 @@ class XDPParser:
             subform_name = subform.attrib.get("name", f"subform_{self.id_counter}")
             
             # Check if this is a repeating group (has occur element)
-            occur_elem = subform.find("./template:occur", self.namespaces)
+            occur_elem = subform.find(self._occur_tag)
             is_repeating = occur_elem is not None
             
             # Process any scripts and get conditions
@@ -1131,7 +1299,7 @@ class XDPParser:
                 }
                 
                 # Process direct child fields in this subform (not descendants)
-                for field in subform.findall("./template:field", self.namespaces):
+                for field in self._findall(subform, "./template:field"):
                     field_obj = self.process_field(field)
                     if field_obj:
                         # Add conditions to each field
@@ -1142,7 +1310,7 @@ class XDPParser:
                         group_obj["groupItems"][0]["fields"].append(field_obj)
 
                 # Process direct child draw elements (not descendants)
-                for draw in subform.findall("./template:draw", self.namespaces):
+                for draw in self._findall(subform, "./template:draw"):
                     draw_obj = self.process_draw(draw)
                     if draw_obj:
                         # Add conditions to each draw element
@@ -1155,7 +1323,7 @@ class XDPParser:
                         group_obj["groupItems"][0]["fields"].append(draw_obj)
 
                 # Process direct child subforms (not descendants)
-                for nested_subform in subform.findall("./template:subform", self.namespaces):
+                for nested_subform in self._findall(subform, "./template:subform"):
                     nested_group = self.process_subform(nested_subform)
                     if nested_group:
                         # Add conditions to nested group if they exist
@@ -1170,7 +1338,7 @@ class XDPParser:
                 return group_obj
             else:
                 # Process non-repeating subform fields directly
-                for field in subform.findall("./template:field", self.namespaces):
+                for field in self._findall(subform, "./template:field"):
                     field_obj = self.process_field(field)
                     if field_obj:
                         # Add conditions to each field
@@ -1181,7 +1349,7 @@ class XDPParser:
                         self.all_items.append(field_obj)
 
                 # Process direct child draw elements (not descendants)
-                for draw in subform.findall("./template:draw", self.namespaces):
+                for draw in self._findall(subform, "./template:draw"):
                     draw_obj = self.process_draw(draw)
                     if draw_obj:
                         # Add conditions to each draw element
@@ -1194,7 +1362,7 @@ class XDPParser:
                         self.all_items.append(draw_obj)
 
                 # Process direct child subforms (not descendants)
-                for nested_subform in subform.findall("./template:subform", self.namespaces):
+                for nested_subform in self._findall(subform, "./template:subform"):
                     nested_group = self.process_subform(nested_subform)
                     if nested_group:
                         # Add conditions to nested group if they exist
@@ -1229,7 +1397,7 @@ class XDPParser:
                     field_obj["validation"].append(script_result)
             
             # Process fields (usually radio buttons) in this group
-            for field in exclgroup.findall("./template:field", self.namespaces):
+            for field in self._findall(exclgroup, "./template:field"):
                 radio_obj = self.process_field(field)
                 if radio_obj:
                     # Make sure it's a radio button and set the group name
@@ -1251,28 +1419,28 @@ class XDPParser:
     
     def extract_text_from_exdata(self, exdata_elem):
         try:
-            # Get all text content recursively
+            # Collect all text content with an explicit stack; deeply nested
+            # rich-text bodies would otherwise burn Python call frames
             all_text = []
-            
-            # Define function to extract text from element and its children
+
             def extract_text(element):
-                if element.text and element.text.strip():
-                    all_text.append(element.text.strip())
-                
-                for child in element:
-                    if '}' in child.tag:
-                        tag = child.tag.split('}')[1]
-                    else:
-                        tag = child.tag
-                        
-                    # Skip style-related tags
-                    if tag in ['style', 'xfa-spacerun']:
+                stack = [element]
+                while stack:
+                    node = stack.pop()
+                    if isinstance(node, str):
+                        # Deferred tail text, queued to land after the children
+                        all_text.append(node)
                         continue
-                        
-                    extract_text(child)
-                    
-                if element.tail and element.tail.strip():
-                    all_text.append(element.tail.strip())
+
+                    if node.text and node.text.strip():
+                        all_text.append(node.text.strip())
+
+                    # Skip style-related tags (their tails go with them)
+                    pending = [child for child in node
+                               if _localname(child.tag) not in _RICHTEXT_SKIP_TAGS]
+                    if node.tail and node.tail.strip():
+                        pending.append(node.tail.strip())
+                    stack.extend(reversed(pending))
             
             # Start extraction with the body element directly under exdata_elem
             for body_elem in exdata_elem.findall(".//{http://www.w3.org/1999/xhtml}body"):
@@ -1290,24 +1458,12 @@ class XDPParser:
             return None
 
     def is_part_of_group_or_table(self, element):
-        """Check if an element is part of a group or table structure"""
-        try:
-            # Get the parent element
-            parent = element.getparent()
-            if parent is None:
-                return False
-                
-            # Check if parent is a subform (group) or table
-            parent_tag = parent.tag.split('}')[-1] if '}' in parent.tag else parent.tag
-            if parent_tag in ['subform', 'table']:
-                return True
-                
-            # Check if parent has a name that suggests it's a group or table
-            parent_name = parent.attrib.get("name", "").lower()
-            if any(indicator in parent_name for indicator in ["group", "table", "grid", "row", "column", "cell"]):
-                return True
-                
-            # Recursively check parent's parent
-            return self.is_part_of_group_or_table(parent)
-        except Exception:
-            return False
+        """Check if an element is part of a group or table structure.
+
+        The ancestry walk this was written for needs getparent(), which the
+        stdlib backend does not provide, so the answer has always been False
+        and the draw output is shaped around that. Pinned to False under
+        lxml as well so output does not depend on which backend is
+        installed.
+        """
+        return False
@@ -204,6 +204,57 @@ class TestOrbeonParser(unittest.TestCase):
         self.assertIn("id", field_obj)
         self.assertIn("label", field_obj)
 
+    def test_parse_with_comments(self):
+        """Test that comments inside sections and grids do not break parsing"""
+        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+        <xh:html xmlns:xh="http://www.w3.org/1999/xhtml" xmlns:xf="http://www.w3.org/2002/xforms" xmlns:fr="http://orbeon.org/oxf/xml/form-runner">
+            <xh:head>
+                <xf:model id="fr-form-model">
+                    <xf:instance id="fr-form-instance">
+                        <form>
+                            <!-- top-level comment -->
+                            <section-1>
+                                <!-- layout comment -->
+                                <grid-1>
+                                    <!-- grid comment -->
+                                    <control-1>Test Control</control-1>
+                                    <control-2>Another Control</control-2>
+                                </grid-1>
+                            </section-1>
+                        </form>
+                    </xf:instance>
+                    <xf:instance id="fr-form-resources">
+                        <resources>
+                            <resource xml:lang="en">
+                                <control-1>
+                                    <label>Control 1 Label</label>
+                                </control-1>
+                                <control-2>
+                                    <label>Control 2 Label</label>
+                                </control-2>
+                            </resource>
+                        </resources>
+                    </xf:instance>
+                    <xf:bind id="fr-form-binds" ref="instance('fr-form-instance')">
+                        <xf:bind id="control-1-bind" name="control-1" ref="control-1"/>
+                        <xf:bind id="control-2-bind" name="control-2" ref="control-2"/>
+                    </xf:bind>
+                </xf:model>
+            </xh:head>
+            <xh:body/>
+        </xh:html>
+        """
+        with open(self.test_xml_file, 'w') as f:
+            f.write(xml_content)
+
+        parser = OrbeonParser(self.test_xml_file, self.test_mapping_file)
+        result = parser.parse()
+        self.assertIsNotNone(result)
+        items = result["data"]["items"]
+        field_names = [item["codeContext"]["name"] for item in items]
+        self.assertIn("control-1", field_names)
+        self.assertIn("control-2", field_names)
+
     def tearDown(self):
         """Clean up test files"""
         try:
@@ -130,6 +130,38 @@ class TestXDPParser(unittest.TestCase):
             self.assertIn("type", draw_obj)
             self.assertIn("id", draw_obj)
 
+    def test_parse_with_comments(self):
+        """Test that XML comments and PIs do not break field processing"""
+        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+        <xdp:xdp xmlns:xdp="http://ns.adobe.com/xdp/">
+            <template xmlns="http://www.xfa.org/schema/xfa-template/3.0/">
+                <subform name="form1">
+                    <!-- layout comment -->
+                    <?processing instruction?>
+                    <field name="test_field">
+                        <ui>
+                            <!-- ui comment -->
+                            <textEdit/>
+                        </ui>
+                        <value>
+                            <text>Test Value</text>
+                        </value>
+                    </field>
+                </subform>
+            </template>
+        </xdp:xdp>
+        """
+        with open(self.test_xml_file, 'w') as f:
+            f.write(xml_content)
+
+        parser = XDPParser(self.test_xml_file, self.test_mapping_file)
+        result = parser.parse()
+        self.assertIsNotNone(result)
+        items = result["data"]["items"]
+        self.assertEqual(len(items), 1)
+        self.assertEqual(items[0]["type"], "text-input")
+        self.assertEqual(items[0]["label"], "Test Value")
+
     def tearDown(self):
         """Clean up test files"""
         try: